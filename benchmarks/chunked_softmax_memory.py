@@ -0,0 +1,49 @@
+"""
+Пиковая память и время шага для выходного слоя с большим числом классов:
+Linear + CrossEntropyLoss против LinearCrossEntropyLoss.
+
+Запуск из корня репозитория:
+    python -m benchmarks.chunked_softmax_memory
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.nn import Linear, CrossEntropyLoss, LinearCrossEntropyLoss
+from src.tensor import Tensor
+
+
+def measure(step):
+    """Возвращает (пиковая память в МБ, время в секундах) для одного вызова step."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    step()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2 ** 20, elapsed
+
+
+def main(batch_size=256, in_features=128, class_counts=(10_000, 50_000, 100_000, 200_000), chunk_size=8192):
+    x = np.random.randn(batch_size, in_features)
+    print(f"{'classes':>8} | {'full, MB':>9} {'full, s':>8} | {'chunked, MB':>11} {'chunked, s':>10}")
+    for num_classes in class_counts:
+        target = np.random.randint(num_classes, size=batch_size)
+        linear = Linear(in_features, num_classes)
+        fused = LinearCrossEntropyLoss(in_features, num_classes, chunk_size=chunk_size)
+
+        def full_step():
+            loss = CrossEntropyLoss(Tensor(linear(x)), target)
+            linear.backward(loss.grad)
+
+        def chunked_step():
+            fused(Tensor(x), target).backward()
+
+        full_mem, full_time = measure(full_step)
+        chunked_mem, chunked_time = measure(chunked_step)
+        print(f"{num_classes:>8} | {full_mem:>9.1f} {full_time:>8.3f} | {chunked_mem:>11.1f} {chunked_time:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
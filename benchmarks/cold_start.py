@@ -0,0 +1,93 @@
+"""
+Холодный старт пакетного инференса: загрузка модели и первый батч в новом процессе.
+
+Сравниваются текущий путь (импорт src, сборка Sequential с инициализацией Kaiming,
+загрузка весов из .npz) и замороженная модель (src.utils.export.freeze + src.runtime.load).
+
+Запуск из корня репозитория:
+    python -m benchmarks.cold_start
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import src
+from src.nn import Sequential, Linear, BatchNorm, ReLU
+from src.utils.export import freeze
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARCHITECTURE = ("Sequential(Linear(784, 1024), BatchNorm(1024), ReLU(), Linear(1024, 1024), BatchNorm(1024), ReLU(), "
+                "Linear(1024, 10))")
+
+TRAINING_PATH = """
+import time
+start = time.perf_counter()
+import numpy as np
+from src.nn import Sequential, Linear, BatchNorm, ReLU
+model = {architecture}
+state = np.load({weights!r})
+for i, param in enumerate(model.parameters()):
+    param.data = state[f"param_{{i}}"]
+for i, module in enumerate(model.modules):
+    if isinstance(module, BatchNorm):
+        module.running_mean = state[f"mean_{{i}}"]
+        module.running_var = state[f"var_{{i}}"]
+model.eval()
+loaded = time.perf_counter()
+model(np.load({batch!r})).array
+print(loaded - start, time.perf_counter() - loaded)
+"""
+
+FROZEN_PATH = """
+import time
+start = time.perf_counter()
+import numpy as np
+from src import runtime
+model = runtime.load({weights!r})
+loaded = time.perf_counter()
+model(np.load({batch!r}))
+print(loaded - start, time.perf_counter() - loaded)
+"""
+
+
+def run(code, repeats):
+    """Запускает code в новых процессах; возвращает медианы (загрузка, первый батч, весь процесс)."""
+    results = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        total = time.perf_counter() - start
+        load, first_batch = map(float, out.stdout.split())
+        results.append((load, first_batch, total))
+    return np.median(np.array(results), axis=0)
+
+
+def main(batch_size=256, repeats=5):
+    src.manual_seed(0)
+    model = eval(ARCHITECTURE)
+    model.eval()
+    with tempfile.TemporaryDirectory() as tmp:
+        state = {f"param_{i}": param.data for i, param in enumerate(model.parameters())}
+        for i, module in enumerate(model.modules):
+            if isinstance(module, BatchNorm):
+                state[f"mean_{i}"] = module.running_mean
+                state[f"var_{i}"] = module.running_var
+        weights = os.path.join(tmp, "model.npz")
+        np.savez(weights, **state)
+        frozen = os.path.join(tmp, "model.nnf")
+        freeze(model, frozen)
+        batch = os.path.join(tmp, "batch.npy")
+        np.save(batch, np.random.randn(batch_size, 784).astype(np.float32))
+
+        print(f"{'path':>8} | {'load, ms':>8} {'first batch, ms':>15} {'process, ms':>11}")
+        for name, template, path in (("current", TRAINING_PATH, weights), ("frozen", FROZEN_PATH, frozen)):
+            load, first_batch, total = run(template.format(architecture=ARCHITECTURE, weights=path, batch=batch), repeats)
+            print(f"{name:>8} | {load * 1e3:>8.1f} {first_batch * 1e3:>15.1f} {total * 1e3:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Пропускная способность обучения ансамбля: Ensemble против E отдельных моделей,
+обучаемых по очереди.
+
+Архитектура участника: Linear(64, 64), ReLU, Linear(64, 64), ReLU, Linear(64, 10);
+батч общий для всех участников, оптимизатор Adam. Выводится число шагов обучения
+участников в секунду (E шагов отдельных моделей = один шаг ансамбля).
+
+Запуск из корня репозитория:
+    python -m benchmarks.ensemble_throughput
+"""
+import time
+
+import numpy as np
+
+import src
+from src.nn import Sequential, Linear, ReLU, CrossEntropyLoss, Ensemble
+from src.optim import Adam
+
+
+def make_model():
+    return Sequential(Linear(64, 64), ReLU(), Linear(64, 64), ReLU(), Linear(64, 10))
+
+
+def measure(step, steps):
+    step()
+    start = time.perf_counter()
+    for _ in range(steps):
+        step()
+    return time.perf_counter() - start
+
+
+def member_steps_per_sec(num_members, x, y, steps):
+    src.manual_seed(0)
+    models = [make_model() for _ in range(num_members)]
+    optimizers = [Adam(model.parameters()) for model in models]
+
+    def separate_step():
+        for model, optimizer in zip(models, optimizers):
+            optimizer.zero_grad()
+            CrossEntropyLoss(model(x), y).backward()
+            optimizer.step()
+
+    ensemble = Ensemble(models)
+    ensemble_optimizer = Adam(ensemble.parameters())
+
+    def ensemble_step():
+        ensemble_optimizer.zero_grad()
+        CrossEntropyLoss(ensemble(x), y).backward()
+        ensemble_optimizer.step()
+
+    separate = num_members * steps / measure(separate_step, steps)
+    stacked = num_members * steps / measure(ensemble_step, steps)
+    return separate, stacked
+
+
+def main(member_counts=(1, 4, 16, 32), batch_size=128, steps=200):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((batch_size, 64))
+    y = rng.integers(0, 10, batch_size)
+    print(f"{'members':>7} | {'separate':>10} {'Ensemble':>10} {'speedup':>8}")
+    for num_members in member_counts:
+        separate, stacked = member_steps_per_sec(num_members, x, y, steps)
+        print(f"{num_members:>7} | {separate:>10.0f} {stacked:>10.0f} {stacked / separate:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
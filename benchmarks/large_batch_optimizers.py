@@ -0,0 +1,78 @@
+"""
+Время до целевой точности для Adam, LAMB и LARS при разных размерах батча.
+
+Данные синтетические: метки задаёт случайная «учительская» сеть. Скорость обучения
+масштабируется с размером батча (sqrt для Adam/LAMB, линейно для LARS) и
+используется прогрев с косинусным затуханием.
+
+Запуск из корня репозитория:
+    python -m benchmarks.large_batch_optimizers
+"""
+import time
+
+import numpy as np
+
+import src
+from src.nn import Sequential, Linear, BatchNorm, ReLU, CrossEntropyLoss
+from src.optim import Adam, LAMB, LARS, WarmupDecayLR
+from src.utils.data import DataLoader
+
+BASE_BATCH = 64
+OPTIMIZERS = {
+    "Adam": (Adam, 1e-3, 0.5),
+    "LAMB": (LAMB, 2e-3, 0.5),
+    "LARS": (LARS, 0.5, 1.0),
+}
+
+
+def make_data(num_samples=20000, num_features=32, num_classes=10, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal((num_samples, num_features)).astype(np.float32)
+    teacher_1 = rng.standard_normal((num_features, 64))
+    teacher_2 = rng.standard_normal((64, num_classes))
+    y = np.argmax(np.maximum(x @ teacher_1, 0) @ teacher_2, axis=1)
+    split = num_samples * 4 // 5
+    return (x[:split], y[:split]), (x[split:], y[split:])
+
+
+def accuracy(model, x, y):
+    model.eval()
+    pred = np.argmax(model(x).array, axis=1)
+    model.train()
+    return np.mean(pred == y)
+
+
+def time_to_target(name, batch_size, train, test, target, max_epochs):
+    optimizer_cls, base_lr, lr_power = OPTIMIZERS[name]
+    src.manual_seed(0)
+    model = Sequential(Linear(32, 256), BatchNorm(256), ReLU(), Linear(256, 256), BatchNorm(256), ReLU(),
+                       Linear(256, 10))
+    optimizer = optimizer_cls(model.parameters(), lr=base_lr * (batch_size / BASE_BATCH) ** lr_power)
+    loader = DataLoader(list(zip(*train)), batch_size=batch_size, shuffle=True, drop_last=True)
+    scheduler = WarmupDecayLR(optimizer, warmup_steps=max(len(loader) // 2, 1), total_steps=len(loader) * max_epochs)
+
+    start = time.perf_counter()
+    for epoch in range(1, max_epochs + 1):
+        for x, y in loader:
+            optimizer.zero_grad()
+            CrossEntropyLoss(model(x), y).backward()
+            optimizer.step()
+            scheduler.step()
+        acc = accuracy(model, *test)
+        if acc >= target:
+            return time.perf_counter() - start, epoch, acc
+    return None, max_epochs, acc
+
+
+def main(batch_sizes=(64, 512, 2048), target=0.75, max_epochs=30):
+    train, test = make_data()
+    print(f"{'optimizer':>9} {'batch':>6} | {'time, s':>8} {'epochs':>6} {'accuracy':>8}")
+    for batch_size in batch_sizes:
+        for name in OPTIMIZERS:
+            elapsed, epochs, acc = time_to_target(name, batch_size, train, test, target, max_epochs)
+            elapsed = f"{elapsed:8.2f}" if elapsed is not None else f"{'-':>8}"
+            print(f"{name:>9} {batch_size:>6} | {elapsed} {epochs:>6} {acc:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
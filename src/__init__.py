@@ -1 +1,2 @@
-from src.tensor import Tensor
\ No newline at end of file
+from src.tensor import Tensor
+from src.random import manual_seed
\ No newline at end of file
@@ -1,6 +1,8 @@
 from .activation import ReLU, Sigmoid, Tanh
 from .batchnorm import BatchNorm
-from .container import Sequential
+from .container import Sequential, Parallel, Concat, Residual
 from .dropout import Dropout
+from .ensemble import Ensemble, EnsembleLinear, EnsembleBatchNorm
 from .linear import Linear
-from .loss import CrossEntropyLoss
\ No newline at end of file
+from .loss import CrossEntropyLoss, LinearCrossEntropyLoss
+from .rnn import LSTM, GRU
\ No newline at end of file
@@ -1,5 +1,6 @@
 import numpy as np
 from src.nn.module import Module
+from src.parallel import parallel_for
 
 class ReLU(Module):
 
@@ -16,7 +17,9 @@ class ReLU(Module):
             Результат применения ReLU к входным данным.
         """
         self.input = x
-        return np.maximum(0, x)
+        out = np.empty_like(x)
+        parallel_for(lambda s: np.maximum(x[s], 0, out=out[s]), x)
+        return out
 
     def backward(self, grad_output):
         """
@@ -30,7 +33,8 @@ class ReLU(Module):
         np.ndarray, форма (batch_size, num_features)
             Градиент функции ошибки по входу ReLU.
         """
-        grad_input = grad_output * (self.input >= 0).astype(self.input.dtype)
+        grad_input = np.empty(grad_output.shape, dtype=np.result_type(grad_output, self.input))
+        parallel_for(lambda s: np.multiply(grad_output[s], self.input[s] >= 0, out=grad_input[s]), grad_output)
         return grad_input
 
     def __repr__(self):
@@ -51,7 +55,15 @@ class Sigmoid(Module):
         np.ndarray, форма (batch_size, num_features)
             Результат применения сигмоида к входным данным.
         """
-        self.output = 1 / (1 + np.exp(-x))
+        self.output = np.empty(x.shape, dtype=np.result_type(x, np.float32))
+
+        def kernel(s):
+            out = np.negative(x[s], out=self.output[s])
+            np.exp(out, out=out)
+            out += 1
+            np.reciprocal(out, out=out)
+
+        parallel_for(kernel, x)
         return self.output
 
     def backward(self, grad_output):
@@ -66,7 +78,15 @@ class Sigmoid(Module):
         np.ndarray, форма (batch_size, num_features)
             Градиент функции ошибки по входу сигмоида.
         """
-        return self.output * (1 - self.output) * grad_output
+        grad_input = np.empty(grad_output.shape, dtype=np.result_type(grad_output, self.output))
+
+        def kernel(s):
+            out = np.subtract(1, self.output[s], out=grad_input[s])
+            out *= self.output[s]
+            out *= grad_output[s]
+
+        parallel_for(kernel, grad_output)
+        return grad_input
 
     def __repr__(self):
         """Строковое представление слоя Sigmoid."""
@@ -87,7 +107,8 @@ class Tanh(Module):
         np.ndarray, форма (batch_size, num_features)
             Результат применения Tanh к входным данным.
         """
-        self.output = np.tanh(x)
+        self.output = np.empty(x.shape, dtype=np.result_type(x, np.float32))
+        parallel_for(lambda s: np.tanh(x[s], out=self.output[s]), x)
         return self.output
 
     def backward(self, grad_output):
@@ -102,7 +123,15 @@ class Tanh(Module):
         np.ndarray, форма (batch_size, num_features)
             Градиент функции ошибки по входу Tanh.
         """
-        return (1 - self.output ** 2) * grad_output
+        grad_input = np.empty(grad_output.shape, dtype=np.result_type(grad_output, self.output))
+
+        def kernel(s):
+            out = np.square(self.output[s], out=grad_input[s])
+            np.subtract(1, out, out=out)
+            out *= grad_output[s]
+
+        parallel_for(kernel, grad_output)
+        return grad_input
 
 
     def __repr__(self):
@@ -1,6 +1,7 @@
 import numpy as np
 from src.nn.parameter import Parameter
 from src.nn.module import Module
+from src.parallel import parallel_for
 
 class BatchNorm(Module):
     """
@@ -27,14 +28,13 @@ class BatchNorm(Module):
         self.num_features = num_features
         self.momentum = momentum
         self.eps = eps
-        self.gamma = Parameter((num_features,))
+        self.gamma = Parameter((num_features,), no_decay=True)
         self.gamma._init_params(method='ones')
-        self.beta = Parameter((num_features,))
+        self.beta = Parameter((num_features,), no_decay=True)
         self.beta._init_params(method='zeros')
         self.running_mean = np.zeros(num_features)
         self.running_var = np.ones(num_features)
         self.training = True
-        self.x_centered = None
         self.x_hat = None
         self.var = None
 
@@ -59,24 +59,50 @@ class BatchNorm(Module):
             Результат применения BatchNorm к входным данным.
         """
         if self.training:
-            mu = np.mean(x, axis=0)
-            var = np.var(x, axis=0)
+            # Статистики считаются по частям батча в разных потоках и объединяются
+            parts = parallel_for(lambda s: (len(x[s]), np.mean(x[s], axis=0), np.var(x[s], axis=0)), x)
+            if len(parts) == 1:
+                _, mu, var = parts[0]
+            else:
+                counts = np.array([n for n, _, _ in parts])[:, None]
+                means = np.stack([m for _, m, _ in parts])
+                variances = np.stack([v for _, _, v in parts])
+                mu = np.sum(counts * means, axis=0) / len(x)
+                var = np.sum(counts * (variances + (means - mu) ** 2), axis=0) / len(x)
 
             self.running_mean = self.momentum * self.running_mean + (1 - self.momentum) * mu
             self.running_var = self.momentum * self.running_var + (1 - self.momentum) * var
 
-            self.x_centered = x - mu
             self.var = var
-            self.x_hat = self.x_centered / np.sqrt(var + self.eps)
-            return self.gamma.data * self.x_hat + self.beta.data
+            inv_std = 1 / np.sqrt(var + self.eps)
+            self.x_hat = np.empty(x.shape, dtype=np.result_type(x, mu))
+            out = np.empty_like(self.x_hat)
 
-        x_hat = (x - self.running_mean) / np.sqrt(self.running_var + self.eps)
-        return self.gamma.data * x_hat + self.beta.data
+            def kernel(s):
+                np.subtract(x[s], mu, out=self.x_hat[s])
+                self.x_hat[s] *= inv_std
+                np.multiply(self.x_hat[s], self.gamma.data, out=out[s])
+                out[s] += self.beta.data
+
+            parallel_for(kernel, x)
+            return out
+
+        inv_std = 1 / np.sqrt(self.running_var + self.eps)
+        out = np.empty(x.shape, dtype=np.result_type(x, self.running_mean))
+
+        def kernel(s):
+            np.subtract(x[s], self.running_mean, out=out[s])
+            out[s] *= inv_std
+            out[s] *= self.gamma.data
+            out[s] += self.beta.data
+
+        parallel_for(kernel, x)
+        return out
 
     def zero_grad(self):
         """Обнуляет накопленные градиенты."""
-        self.gamma.data = np.zeros_like(self.gamma.data)
-        self.beta.data = np.zeros_like(self.beta.data)
+        self.gamma.grad = np.zeros_like(self.gamma.data)
+        self.beta.grad = np.zeros_like(self.beta.data)
 
     def backward(self, grad_output):
         """
@@ -92,14 +118,27 @@ class BatchNorm(Module):
         """
         batch_size = grad_output.shape[0]
 
-        self.gamma.grad += np.sum(grad_output * self.x_hat, axis=0)
-        self.beta.grad += np.sum(grad_output, axis=0)
+        parts = parallel_for(lambda s: (np.sum(grad_output[s] * self.x_hat[s], axis=0),
+                                        np.sum(grad_output[s], axis=0)), grad_output)
+        sum_grad_x_hat = sum(part[0] for part in parts)
+        sum_grad = sum(part[1] for part in parts)
+
+        self.gamma.grad += sum_grad_x_hat
+        self.beta.grad += sum_grad
+
+        # dx = gamma / std * (grad - mean(grad) - x_hat * mean(grad * x_hat))
+        scale = self.gamma.data / np.sqrt(self.var + self.eps)
+        mean_grad = sum_grad / batch_size
+        mean_grad_x_hat = sum_grad_x_hat / batch_size
+        dx = np.empty(grad_output.shape, dtype=np.result_type(grad_output, self.x_hat))
 
-        dx_hat = grad_output * self.gamma.data
-        dvar = np.sum(dx_hat * self.x_centered * -0.5 * (self.var + self.eps) ** (-1.5), axis=0)
-        dmu = np.sum(dx_hat * -1 / np.sqrt(self.var + self.eps), axis=0) + dvar * np.mean(-2 * self.x_centered, axis=0)
-        dx = dx_hat / np.sqrt(self.var + self.eps) + dvar * 2 * self.x_centered / batch_size + dmu / batch_size
+        def kernel(s):
+            np.multiply(self.x_hat[s], mean_grad_x_hat, out=dx[s])
+            np.subtract(grad_output[s], dx[s], out=dx[s])
+            dx[s] -= mean_grad
+            dx[s] *= scale
 
+        parallel_for(kernel, grad_output)
         return dx
 
     def __repr__(self):
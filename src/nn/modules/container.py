@@ -1,3 +1,6 @@
+import numpy as np
+from src.nn.module import Module
+from src.parallel import parallel_map
 from src.tensor import Tensor
 
 class Sequential:
@@ -59,11 +62,7 @@ class Sequential:
             Итератор по параметрам всех слоев.
         """
         for module in self.modules:
-            params = module.parameters()
-            if isinstance(params, tuple):
-                yield from params
-            else:
-                yield params
+            yield from module.parameters()
 
     def zero_grad(self):
         """Обнуляет все накопленные градиенты во всех слоях."""
@@ -103,4 +102,211 @@ class Sequential:
         Возвращает строковое представление модели.
         """
         module_str = ",\n    ".join(map(str, self.modules))
-        return f"Sequential(\n    {module_str}\n)"
\ No newline at end of file
+        return f"Sequential(\n    {module_str}\n)"
+
+def _branch_forward(module, x):
+    """Прямой проход через ветвь; для Sequential возвращает массив, а не Tensor."""
+    out = module(x)
+    return out.array if isinstance(out, Tensor) else out
+
+
+class _Branches(Module):
+    """
+    Общая часть контейнеров с несколькими независимыми ветвями.
+
+    Прямой и обратный проходы ветвей выполняются одновременно в общем пуле потоков
+    (см. src.parallel). Один и тот же экземпляр модуля не должен входить в несколько ветвей.
+    """
+
+    def __init__(self, *branches):
+        if len(branches) == 0:
+            raise ValueError("Должна быть хотя бы одна ветвь")
+        self.branches = branches
+        self._grad_buffer = None
+
+    def _forward_branches(self, x):
+        return parallel_map(lambda branch: _branch_forward(branch, x), self.branches)
+
+    def _backward_branches(self, grads):
+        """
+        Обратный проход по всем ветвям и суммирование градиентов по общему входу
+        в заранее выделенный буфер.
+        """
+        grads_in = parallel_map(lambda args: args[0]._compute_gradients(args[1]), zip(self.branches, grads))
+        if self._grad_buffer is None or self._grad_buffer.shape != grads_in[0].shape:
+            self._grad_buffer = np.empty_like(grads_in[0])
+        np.copyto(self._grad_buffer, grads_in[0])
+        for grad in grads_in[1:]:
+            self._grad_buffer += grad
+        return self._grad_buffer
+
+    def parameters(self):
+        """
+        Возвращает параметры всех ветвей.
+
+        Возвращает:
+        -----------
+        tuple[Parameter]
+            Кортеж, содержащий параметры.
+        """
+        return tuple(param for branch in self.branches for param in branch.parameters())
+
+    def zero_grad(self):
+        """Обнуляет все накопленные градиенты во всех ветвях."""
+        for branch in self.branches:
+            branch.zero_grad()
+
+    def train(self):
+        """Переводит все ветви в режим обучения."""
+        for branch in self.branches:
+            branch.train()
+
+    def eval(self):
+        """Переводит все ветви в режим инференса."""
+        for branch in self.branches:
+            branch.eval()
+
+    def __repr__(self):
+        branch_str = ",\n".join(map(str, self.branches)).replace("\n", "\n    ")
+        return f"{type(self).__name__}(\n    {branch_str}\n)"
+
+
+class Parallel(_Branches):
+    """
+    Применяет все ветви к одному входу и суммирует их выходы.
+
+    Параметры:
+    ----------
+    *branches : список модулей или Sequential
+        Ветви с одинаковой формой выхода.
+
+    Пример инициализации:
+    -----------
+    model = Sequential(Parallel(Sequential(Linear(64, 32), ReLU()), Linear(64, 32)), Linear(32, 10))
+    """
+
+    def forward(self, x):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray
+            Входные данные.
+
+        Возвращает:
+        -----------
+        np.ndarray
+            Сумма выходов ветвей.
+        """
+        outputs = self._forward_branches(x)
+        y = outputs[0].copy()
+        for out in outputs[1:]:
+            y += out
+        return y
+
+    def backward(self, grad_output):
+        """
+        Параметры:
+        ----------
+        grad_output: np.ndarray
+            Градиент функции ошибки по выходу контейнера.
+
+        Возвращает:
+        -----------
+        np.ndarray
+            Градиент функции ошибки по входу контейнера.
+        """
+        return self._backward_branches([grad_output] * len(self.branches))
+
+
+class Concat(_Branches):
+    """
+    Применяет все ветви к одному входу и объединяет их выходы по последней оси
+    (многобашенные модели).
+
+    Параметры:
+    ----------
+    *branches : список модулей или Sequential
+        Ветви (башни).
+
+    Пример инициализации:
+    -----------
+    model = Sequential(Concat(Linear(64, 16), Sequential(Linear(64, 32), ReLU())), Linear(48, 10))
+    """
+
+    def forward(self, x):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray
+            Входные данные.
+
+        Возвращает:
+        -----------
+        np.ndarray
+            Выходы ветвей, объединённые по последней оси.
+        """
+        outputs = self._forward_branches(x)
+        self.split_points = np.cumsum([out.shape[-1] for out in outputs])[:-1]
+        return np.concatenate(outputs, axis=-1)
+
+    def backward(self, grad_output):
+        """
+        Параметры:
+        ----------
+        grad_output: np.ndarray
+            Градиент функции ошибки по выходу контейнера.
+
+        Возвращает:
+        -----------
+        np.ndarray
+            Градиент функции ошибки по входу контейнера.
+        """
+        return self._backward_branches(np.split(grad_output, self.split_points, axis=-1))
+
+
+class Residual(_Branches):
+    """
+    Остаточный блок: y = x + f(x), где f - последовательность модулей.
+
+    Параметры:
+    ----------
+    *modules : список модулей
+        Слои ветви f; выход должен иметь ту же форму, что и вход.
+
+    Пример инициализации:
+    -----------
+    block = Residual(Linear(64, 64), ReLU(), Linear(64, 64))
+    """
+
+    def __init__(self, *modules):
+        if len(modules) == 0:
+            raise ValueError("В остаточном блоке должен быть хотя бы один элемент")
+        super().__init__(modules[0] if len(modules) == 1 else Sequential(*modules))
+
+    def forward(self, x):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray
+            Входные данные.
+
+        Возвращает:
+        -----------
+        np.ndarray
+            x + f(x).
+        """
+        return x + _branch_forward(self.branches[0], x)
+
+    def backward(self, grad_output):
+        """
+        Параметры:
+        ----------
+        grad_output: np.ndarray
+            Градиент функции ошибки по выходу блока.
+
+        Возвращает:
+        -----------
+        np.ndarray
+            Градиент функции ошибки по входу блока.
+        """
+        return grad_output + self.branches[0]._compute_gradients(grad_output)
@@ -1,5 +1,7 @@
 import numpy as np
 from src.nn.module import Module
+from src.parallel import parallel_for
+from src.random import spawn_generator
 
 class Dropout(Module):
     """
@@ -7,11 +9,14 @@ class Dropout(Module):
     ----------
     p: float, по умолчанию 0.5
         Вероятность зануления элемента.
+    generator: np.random.Generator, optional
+        Источник случайных чисел. По умолчанию берётся новый поток из src.random.
     """
 
-    def __init__(self, p=0.5):
+    def __init__(self, p=0.5, generator=None):
         super().__init__()
         self.p = p
+        self.generator = generator if generator is not None else spawn_generator()
         self.is_training = True
         self.mask = None
 
@@ -36,8 +41,19 @@ class Dropout(Module):
             Результат применения Dropout к входным данным.
         """
         if self.is_training:
-            self.mask = (np.random.rand(*x.shape) > self.p).astype(x.dtype)
-            return x * self.mask
+            # Маска из 16-битных целых: быстрее, чем float64 из rand, точность p до 2^-16
+            # Случайные числа берутся одним вызовом, чтобы маска не зависела от числа потоков
+            threshold = np.uint32(round(self.p * 65536))
+            draws = self.generator.integers(0, 65536, size=x.shape, dtype=np.uint16)
+            self.mask = np.empty(x.shape, dtype=x.dtype)
+            out = np.empty_like(self.mask)
+
+            def kernel(s):
+                np.greater_equal(draws[s], threshold, out=self.mask[s])
+                np.multiply(x[s], self.mask[s], out=out[s])
+
+            parallel_for(kernel, x)
+            return out
         else:
             # В режиме инференса Dropout не применяется
             return x * (1 - self.p)
@@ -55,7 +71,9 @@ class Dropout(Module):
             Градиент функции ошибки по входу Dropout.
         """
         if self.is_training:
-            return grad_output * self.mask
+            grad_input = np.empty(grad_output.shape, dtype=np.result_type(grad_output, self.mask))
+            parallel_for(lambda s: np.multiply(grad_output[s], self.mask[s], out=grad_input[s]), grad_output)
+            return grad_input
         else:
             return grad_output
 
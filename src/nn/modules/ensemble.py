@@ -0,0 +1,355 @@
+import copy
+import numpy as np
+from src.nn.parameter import Parameter
+from src.nn.module import Module
+from src.nn.modules.batchnorm import BatchNorm
+from src.nn.modules.container import Sequential
+from src.nn.modules.linear import Linear
+from src.random import spawn_generator
+
+
+def _stack_parameters(params):
+    """Складывает одинаковые параметры участников ансамбля вдоль новой первой оси."""
+    data = np.stack([p.data for p in params])
+    stacked = Parameter(data.shape, no_decay=params[0].no_decay)
+    stacked.data = data
+    stacked.num_members = len(params)
+    return stacked
+
+
+def _copy_module(module):
+    """Копия слоя без параметров; слой со своим генератором (Dropout) получает новый поток."""
+    module = copy.copy(module)
+    if isinstance(getattr(module, 'generator', None), np.random.Generator):
+        module.generator = spawn_generator()
+    return module
+
+
+def _member_parameter(param, i, shape):
+    """Извлекает параметр i-го участника ансамбля."""
+    member = Parameter(shape, no_decay=param.no_decay)
+    member.data = param.data[i].reshape(shape).copy()
+    return member
+
+
+class EnsembleLinear(Module):
+    """
+    E копий слоя Linear, вычисляемых одним батчевым np.matmul.
+
+    Атрибуты:
+    ---------
+    num_members: int
+        Количество участников ансамбля.
+    W: Parameter, форма (num_members, in_features, out_features)
+        Матрицы весов всех участников.
+    b: Parameter or None, форма (num_members, 1, out_features)
+        Векторы смещений всех участников или None, если bias=False.
+    """
+
+    def __init__(self, layers):
+        self.num_members = len(layers)
+        self.in_features = layers[0].in_features
+        self.out_features = layers[0].out_features
+        self.bias = layers[0].bias
+        self.W = _stack_parameters([layer.W for layer in layers])
+        if self.bias:
+            self.b = _stack_parameters([layer.b for layer in layers])
+            self.b.data = self.b.data.reshape(self.num_members, 1, self.out_features)
+            self.b.grad = np.zeros_like(self.b.data)
+        else:
+            self.b = None
+
+    def forward(self, x):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray, форма (num_members, batch_size, in_features)
+            Входные данные.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (num_members, batch_size, out_features)
+            Результат применения всех участников к входным данным.
+        """
+        y = np.matmul(x, self.W.data)
+        if self.bias:
+            y += self.b.data
+        self.x = x
+        return y
+
+    def backward(self, grad_output):
+        """
+        Параметры:
+        ----------
+        grad_output: np.ndarray, форма (num_members, batch_size, out_features)
+            Градиент функции ошибки по выходу слоя.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (num_members, batch_size, in_features)
+            Градиент функции ошибки по входу слоя.
+        """
+        self.W.grad += np.matmul(self.x.transpose(0, 2, 1), grad_output)
+        if self.bias:
+            self.b.grad += grad_output.sum(axis=1, keepdims=True)
+        return np.matmul(grad_output, self.W.data.transpose(0, 2, 1))
+
+    def member(self, i):
+        """
+        Возвращает i-го участника в виде обычного слоя Linear.
+        Конструктор Linear не вызывается, чтобы не инициализировать веса заново
+        и не расходовать потоки src.random.
+        """
+        layer = Linear.__new__(Linear)
+        layer.in_features = self.in_features
+        layer.out_features = self.out_features
+        layer.bias = self.bias
+        layer.W = _member_parameter(self.W, i, (self.in_features, self.out_features))
+        layer.b = _member_parameter(self.b, i, self.out_features) if self.bias else None
+        return layer
+
+    def parameters(self):
+        """
+        Возвращает параметры модели.
+
+        Возвращает:
+        -----------
+        tuple[Parameter]
+            Кортеж, содержащий параметры.
+        """
+        if self.bias:
+            return (self.W, self.b)
+        else:
+            return (self.W,)
+
+    def zero_grad(self):
+        """Обнуляет накопленные градиенты модели."""
+        self.W.grad = np.zeros_like(self.W.data)
+        if self.bias:
+            self.b.grad = np.zeros_like(self.b.data)
+
+    def __repr__(self):
+        """Строковое представление слоя."""
+        return f"EnsembleLinear({self.num_members} x Linear({self.in_features}, {self.out_features}, bias={self.bias}))"
+
+
+class EnsembleBatchNorm(Module):
+    """
+    E копий слоя BatchNorm. Статистики считаются по оси батча отдельно для каждого участника.
+
+    Атрибуты:
+    ----------
+    num_members: int
+        Количество участников ансамбля.
+    gamma: Parameter, форма (num_members, 1, num_features)
+        Обучаемые параметры масштабирования.
+    beta: Parameter, форма (num_members, 1, num_features)
+        Обучаемые параметры сдвига.
+    running_mean: np.ndarray, форма (num_members, 1, num_features)
+        Скользящие средние.
+    running_var: np.ndarray, форма (num_members, 1, num_features)
+        Скользящие дисперсии.
+    """
+
+    def __init__(self, layers):
+        self.num_members = len(layers)
+        self.num_features = layers[0].num_features
+        self.momentum = layers[0].momentum
+        self.eps = layers[0].eps
+        shape = (self.num_members, 1, self.num_features)
+        self.gamma = _stack_parameters([layer.gamma for layer in layers])
+        self.beta = _stack_parameters([layer.beta for layer in layers])
+        for param in (self.gamma, self.beta):
+            param.data = param.data.reshape(shape)
+            param.grad = np.zeros_like(param.data)
+        self.running_mean = np.stack([layer.running_mean for layer in layers]).reshape(shape)
+        self.running_var = np.stack([layer.running_var for layer in layers]).reshape(shape)
+        self.training = layers[0].training
+        self.x_centered = None
+        self.x_hat = None
+        self.var = None
+
+    def train(self):
+        """Переводит слой в режим обучения."""
+        self.training = True
+
+    def eval(self):
+        """Переводит слой в режим инференса."""
+        self.training = False
+
+    def forward(self, x):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray, форма (num_members, batch_size, num_features)
+            Входные данные.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (num_members, batch_size, num_features)
+            Результат применения BatchNorm к входным данным.
+        """
+        if self.training:
+            mu = np.mean(x, axis=1, keepdims=True)
+            var = np.var(x, axis=1, keepdims=True)
+
+            self.running_mean = self.momentum * self.running_mean + (1 - self.momentum) * mu
+            self.running_var = self.momentum * self.running_var + (1 - self.momentum) * var
+
+            self.x_centered = x - mu
+            self.var = var
+            self.x_hat = self.x_centered / np.sqrt(var + self.eps)
+            return self.gamma.data * self.x_hat + self.beta.data
+
+        x_hat = (x - self.running_mean) / np.sqrt(self.running_var + self.eps)
+        return self.gamma.data * x_hat + self.beta.data
+
+    def backward(self, grad_output):
+        """
+        Параметры:
+        ----------
+        grad_output: np.ndarray, форма (num_members, batch_size, num_features)
+            Градиент функции ошибки по выходу слоя.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (num_members, batch_size, num_features)
+            Градиент функции ошибки по входу слоя.
+        """
+        batch_size = grad_output.shape[1]
+
+        self.gamma.grad += np.sum(grad_output * self.x_hat, axis=1, keepdims=True)
+        self.beta.grad += np.sum(grad_output, axis=1, keepdims=True)
+
+        dx_hat = grad_output * self.gamma.data
+        dvar = np.sum(dx_hat * self.x_centered * -0.5 * (self.var + self.eps) ** (-1.5), axis=1, keepdims=True)
+        dmu = (np.sum(dx_hat * -1 / np.sqrt(self.var + self.eps), axis=1, keepdims=True)
+               + dvar * np.mean(-2 * self.x_centered, axis=1, keepdims=True))
+        dx = dx_hat / np.sqrt(self.var + self.eps) + dvar * 2 * self.x_centered / batch_size + dmu / batch_size
+
+        return dx
+
+    def member(self, i):
+        """
+        Возвращает i-го участника в виде обычного слоя BatchNorm (без вызова конструктора,
+        как в EnsembleLinear.member).
+        """
+        layer = BatchNorm.__new__(BatchNorm)
+        layer.num_features = self.num_features
+        layer.momentum = self.momentum
+        layer.eps = self.eps
+        layer.gamma = _member_parameter(self.gamma, i, (self.num_features,))
+        layer.beta = _member_parameter(self.beta, i, (self.num_features,))
+        layer.running_mean = self.running_mean[i, 0].copy()
+        layer.running_var = self.running_var[i, 0].copy()
+        layer.training = self.training
+        layer.x_hat = None
+        layer.var = None
+        return layer
+
+    def zero_grad(self):
+        """Обнуляет накопленные градиенты."""
+        self.gamma.grad = np.zeros_like(self.gamma.data)
+        self.beta.grad = np.zeros_like(self.beta.data)
+
+    def parameters(self):
+        """
+        Возвращает параметры модели.
+
+        Возвращает:
+        -----------
+        tuple[Parameter]
+            Кортеж, содержащий параметры.
+        """
+        return (self.gamma, self.beta)
+
+    def __repr__(self):
+        """Строковое представление слоя."""
+        return (f"EnsembleBatchNorm({self.num_members} x BatchNorm(num_features={self.num_features}, "
+                f"momentum={self.momentum}, eps={self.eps}))")
+
+
+class Ensemble(Sequential):
+    """
+    Ансамбль из нескольких моделей Sequential одинаковой архитектуры, обучаемых за один проход.
+
+    Параметры всех участников складываются вдоль первой оси, поэтому каждый слой
+    выполняется одним батчевым вызовом для всех участников, а SGD и Adam обновляют
+    всех участников одним векторизованным шагом. Слои без параметров (активации, Dropout)
+    поэлементны и копируются; копии Dropout получают собственные потоки случайных чисел.
+
+    Выход модели имеет форму (num_members, batch_size, ...). CrossEntropyLoss
+    возвращает для такого выхода массив ошибок отдельных участников.
+
+    Параметры:
+    ----------
+    models : list[Sequential]
+        Модели-участники (например, с разной инициализацией).
+
+    Исключения:
+    -----------
+    ValueError
+        Если список моделей пуст или архитектуры участников различаются.
+
+    Пример инициализации:
+    -----------
+    ensemble = Ensemble([Sequential(Linear(784, 64), ReLU(), Linear(64, 10)) for _ in range(16)])
+    """
+
+    def __init__(self, models):
+        if len(models) == 0:
+            raise ValueError("В ансамбле должна быть хотя бы одна модель")
+        if any(len(model.modules) != len(models[0].modules) for model in models):
+            raise ValueError("Все модели ансамбля должны иметь одинаковую архитектуру")
+        self.num_members = len(models)
+        super().__init__(*[self._stack_modules(layers) for layers in zip(*[model.modules for model in models])])
+
+    @staticmethod
+    def _stack_modules(layers):
+        """Строит ансамблевый слой из соответствующих слоёв всех участников."""
+        if any(type(layer) is not type(layers[0]) or repr(layer) != repr(layers[0]) for layer in layers):
+            raise ValueError("Все модели ансамбля должны иметь одинаковую архитектуру")
+        if isinstance(layers[0], Linear):
+            return EnsembleLinear(layers)
+        if isinstance(layers[0], BatchNorm):
+            return EnsembleBatchNorm(layers)
+        if layers[0].parameters():
+            raise ValueError(f"Слой {layers[0]!r} не поддерживается в ансамбле")
+        return _copy_module(layers[0])
+
+    def forward(self, x):
+        """
+        Прямой проход через всех участников ансамбля.
+
+        Параметры:
+        ----------
+        x: np.ndarray, форма (batch_size, ...) или (num_members, batch_size, ...)
+            Общий для всех участников батч или отдельный батч для каждого (бэггинг).
+
+        Возвращает:
+        -----------
+        Tensor
+            Выходы всех участников, форма (num_members, batch_size, ...).
+        """
+        if x.ndim == 2:
+            x = np.broadcast_to(x, (self.num_members,) + x.shape)
+        return super().forward(x)
+
+    def member(self, i):
+        """
+        Извлекает i-го участника ансамбля.
+
+        Возвращает:
+        -----------
+        Sequential
+            Независимая модель с копией параметров участника.
+        """
+        return Sequential(*[module.member(i) if hasattr(module, 'member') else _copy_module(module)
+                            for module in self.modules])
+
+    def __repr__(self):
+        """
+        Возвращает строковое представление ансамбля.
+        """
+        module_str = ",\n    ".join(map(str, self.modules))
+        return f"Ensemble(num_members={self.num_members},\n    {module_str}\n)"
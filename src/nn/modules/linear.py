@@ -25,7 +25,7 @@ class Linear(Module):
         self.bias = bias
         self.W = Parameter((in_features, out_features))._init_params("kaiming")
         if self.bias:
-            self.b = Parameter(out_features)
+            self.b = Parameter(out_features, no_decay=True)
         else:
             self.b = None
 
@@ -82,7 +82,7 @@ class Linear(Module):
         """Обнуляет накопленные градиенты модели."""
         self.W.grad = np.zeros_like(self.W.data)
         if self.bias:
-            self.b.grad = np.zeros_like(self.W.data)
+            self.b.grad = np.zeros_like(self.b.data)
 
     def __repr__(self):
         """Строковое представление слоя Linear."""
@@ -1,4 +1,8 @@
 import numpy as np
+from src.nn.parameter import Parameter
+from src.nn.module import Module
+from src.parallel import parallel_for
+from src.random import spawn_generator
 
 class Loss:
     """
@@ -37,7 +41,14 @@ class Loss:
         """
         Запускает обратное распространение ошибки,
         передавая градиенты в модель.
+
+        Исключения:
+        -----------
+        RuntimeError
+            Если ошибка вычислена без градиента (например, в режиме инференса).
         """
+        if self.grad is None:
+            raise RuntimeError("Ошибка вычислена без градиента (режим инференса), backward недоступен")
         self.model._compute_gradients(self.grad)
 
     def __repr__(self):
@@ -50,29 +61,271 @@ def CrossEntropyLoss(pred, target):
     Параметры:
     ----------
     pred: Tensor
-        Логиты модели, форма (batch_size, num_classes).
-    target: np.ndarray, форма (batch_size,)
+        Логиты модели, форма (batch_size, num_classes) или
+        (num_members, batch_size, num_classes) для ансамбля.
+    target: np.ndarray, форма (batch_size,) или (num_members, batch_size)
         Истинные классы в виде одномерного массива.
 
     Возвращает:
     -----------
     Loss
-        Контейнер с ошибкой и градиентом.
+        Контейнер с ошибкой и градиентом. Для ансамбля ошибка - массив
+        значений отдельных участников.
     """
     logits = pred.array
     model = pred.model
 
-    # softmax
-    exp_pred = np.exp(logits - np.max(logits, axis=1, keepdims=True))
-    probs = exp_pred / np.sum(exp_pred, axis=1, keepdims=True)
+    batch_size = logits.shape[-2]
+    target = np.broadcast_to(target, logits.shape[:-1])[..., None]
+    grad = np.empty(logits.shape, dtype=np.result_type(logits, np.float32))
+    correct_log_probs = np.empty(logits.shape[:-1], dtype=grad.dtype)
+
+    def kernel(s):
+        # softmax
+        probs = np.subtract(logits[s], np.max(logits[s], axis=-1, keepdims=True), out=grad[s])
+        np.exp(probs, out=probs)
+        probs /= np.sum(probs, axis=-1, keepdims=True)
+
+        correct_probs = np.take_along_axis(probs, target[s], axis=-1)
+        correct_log_probs[s] = -np.log(correct_probs[..., 0])
+
+        # Вычисляем градиент
+        np.put_along_axis(probs, target[s], correct_probs - 1, axis=-1)
+        probs /= batch_size
+
+    parallel_for(kernel, logits)
+    loss = np.sum(correct_log_probs, axis=-1) / batch_size
+
+    return Loss(loss, grad, model)
+
+
+class _DeferredLoss(Loss):
+    """
+    Ошибка, градиент которой вычисляется только при вызове backward:
+    compute_grad накапливает градиенты параметров слоя ошибки и возвращает
+    градиент по выходу модели. Значение ошибки можно читать без изменения градиентов.
+    """
+
+    def __init__(self, loss, compute_grad, model):
+        super().__init__(loss, None, model)
+        self._compute_grad = compute_grad
+
+    def backward(self):
+        """
+        Накапливает градиенты слоя ошибки и передаёт градиент по выходу в модель
+        (если она есть).
+        """
+        self.grad = self._compute_grad()
+        if self.model is not None:
+            self.model._compute_gradients(self.grad)
+
+
+class LinearCrossEntropyLoss(Module):
+    """
+    Выходной слой Linear, объединённый с CrossEntropyLoss, для очень большого числа классов.
+
+    Логиты считаются блоками по chunk_size классов и никогда не хранятся целиком.
+    При вызове первый проход вычисляет log-sum-exp с онлайн-обновлением максимума
+    и значение ошибки. Второй проход выполняется в Loss.backward: он пересчитывает
+    блоки логитов, накапливает градиенты по W и b и передаёт в модель градиент
+    по её выходу. Поэтому вычисление ошибки без backward (например, для мониторинга)
+    не меняет градиенты. backward нужно вызвать до следующего прямого прохода модели.
+
+    Атрибуты:
+    ---------
+    in_features: int
+        Размерность входного вектора.
+    num_classes: int
+        Количество классов.
+    chunk_size: int, по умолчанию 8192
+        Количество классов в одном блоке.
+    num_samples: int or None, по умолчанию None
+        Если задано, при обучении используется sampled softmax: ошибка считается по
+        истинным классам батча и num_samples случайным классам. В режиме инференса
+        всегда считается точный softmax по всем классам.
+    generator: np.random.Generator, optional
+        Источник случайных чисел для sampled softmax. По умолчанию берётся новый поток из src.random.
+    W: Parameter
+        Матрица весов, форма (in_features, num_classes).
+    b: Parameter
+        Вектор смещений, форма (num_classes,).
+
+    Пример использования:
+    -----------
+    criterion = LinearCrossEntropyLoss(256, 100_000)
+    optimizer = Adam(list(model.parameters()) + list(criterion.parameters()))
+    loss = criterion(model(x), y)
+    loss.backward()     # градиенты W, b и модели накапливаются здесь, а не при вызове criterion
+    """
+
+    def __init__(self, in_features, num_classes, chunk_size=8192, num_samples=None, generator=None):
+        self.in_features = in_features
+        self.num_classes = num_classes
+        self.chunk_size = chunk_size
+        self.num_samples = num_samples
+        self.generator = generator if generator is not None else spawn_generator()
+        self.W = Parameter((in_features, num_classes))._init_params("kaiming")
+        self.b = Parameter((num_classes,), no_decay=True)
+        self.training = True
+
+    def train(self):
+        """Переводит слой в режим обучения."""
+        self.training = True
+
+    def eval(self):
+        """Переводит слой в режим инференса (точный softmax, без градиентов)."""
+        self.training = False
 
-    batch_size = logits.shape[0]
-    correct_log_probs = -np.log(probs[np.arange(batch_size), target])
-    loss = np.sum(correct_log_probs) / batch_size
+    def _chunks(self):
+        """Границы блоков классов."""
+        for start in range(0, self.num_classes, self.chunk_size):
+            yield start, min(start + self.chunk_size, self.num_classes)
 
-    # Вычисляем градиент
-    grad = probs
-    grad[np.arange(batch_size), target] -= 1
-    grad /= batch_size
+    def _logits(self, x, start, end):
+        """Логиты для классов [start, end)."""
+        z = np.dot(x, self.W.data[:, start:end])
+        z += self.b.data[start:end]
+        return z
 
-    return Loss(loss, grad, model)
\ No newline at end of file
+    def forward(self, pred, target):
+        """
+        Параметры:
+        ----------
+        pred: Tensor
+            Выход модели перед выходным слоем, форма (batch_size, in_features).
+        target: np.ndarray, форма (batch_size,)
+            Истинные классы в виде одномерного массива.
+
+        Возвращает:
+        -----------
+        Loss
+            Контейнер с ошибкой. Градиенты вычисляются при вызове backward;
+            в режиме инференса backward недоступен.
+        """
+        x = pred.array
+        target = np.asarray(target)
+        if self.training and self.num_samples is not None:
+            loss, compute_grad = self._sampled(x, target)
+            return _DeferredLoss(loss, compute_grad, pred.model)
+
+        batch_size = x.shape[0]
+        rows = np.arange(batch_size)
+
+        # Первый проход: онлайн log-sum-exp и логиты истинных классов
+        running_max = np.full(batch_size, -np.inf)
+        running_sum = np.zeros(batch_size)
+        target_logits = np.empty(batch_size)
+        for start, end in self._chunks():
+            z = self._logits(x, start, end)
+            hit = (target >= start) & (target < end)
+            target_logits[hit] = z[rows[hit], target[hit] - start]
+
+            new_max = np.maximum(running_max, z.max(axis=1))
+            running_sum *= np.exp(running_max - new_max)
+            z -= new_max[:, None]
+            running_sum += np.exp(z, out=z).sum(axis=1)
+            running_max = new_max
+        lse = running_max + np.log(running_sum)
+        loss = np.sum(lse - target_logits) / batch_size
+
+        if not self.training:
+            return Loss(loss, None, pred.model)
+        return _DeferredLoss(loss, lambda: self._backward(x, target, lse), pred.model)
+
+    def _backward(self, x, target, lse):
+        """Второй проход: вероятности блока, градиенты по W, b и градиент по входу."""
+        batch_size = x.shape[0]
+        rows = np.arange(batch_size)
+        grad = np.zeros_like(x, dtype=self.W.data.dtype)
+        for start, end in self._chunks():
+            z = self._logits(x, start, end)
+            z -= lse[:, None]
+            probs = np.exp(z, out=z)
+            hit = (target >= start) & (target < end)
+            probs[rows[hit], target[hit] - start] -= 1
+            probs /= batch_size
+
+            self.W.grad[:, start:end] += np.dot(x.T, probs)
+            self.b.grad[start:end] += probs.sum(axis=0)
+            grad += np.dot(probs, self.W.data[:, start:end].T)
+        return grad
+
+    def _sampled(self, x, target):
+        """
+        Sampled softmax: softmax по истинным классам батча и num_samples равномерно
+        выбранным классам. При равномерном выборе поправка log Q одинакова для всех
+        кандидатов и сокращается.
+
+        Возвращает значение ошибки и функцию, накапливающую градиенты.
+        """
+        batch_size = x.shape[0]
+        sampled = self.generator.integers(0, self.num_classes, size=self.num_samples)
+        candidates = np.union1d(target, sampled)
+        target_pos = np.searchsorted(candidates, target)
+
+        W = self.W.data[:, candidates]
+        z = np.dot(x, W) + self.b.data[candidates]
+        z -= z.max(axis=1, keepdims=True)
+        np.exp(z, out=z)
+        probs = z / z.sum(axis=1, keepdims=True)
+
+        rows = np.arange(batch_size)
+        loss = -np.sum(np.log(probs[rows, target_pos])) / batch_size
+
+        def compute_grad():
+            dz = probs.copy()
+            dz[rows, target_pos] -= 1
+            dz /= batch_size
+            self.W.grad[:, candidates] += np.dot(x.T, dz)
+            self.b.grad[candidates] += dz.sum(axis=0)
+            return np.dot(dz, W.T)
+
+        return loss, compute_grad
+
+    def predict(self, x):
+        """
+        Предсказание классов без хранения всех логитов.
+
+        Параметры:
+        ----------
+        x: Tensor или np.ndarray, форма (batch_size, in_features)
+            Выход модели перед выходным слоем.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (batch_size,)
+            Индексы классов с максимальным логитом.
+        """
+        if hasattr(x, 'array'):
+            x = x.array
+        best = np.full(x.shape[0], -np.inf)
+        best_class = np.zeros(x.shape[0], dtype=np.int64)
+        for start, end in self._chunks():
+            z = self._logits(x, start, end)
+            idx = z.argmax(axis=1)
+            val = z[np.arange(x.shape[0]), idx]
+            better = val > best
+            best[better] = val[better]
+            best_class[better] = idx[better] + start
+        return best_class
+
+    def parameters(self):
+        """
+        Возвращает параметры слоя.
+
+        Возвращает:
+        -----------
+        tuple[Parameter]
+            Кортеж, содержащий параметры.
+        """
+        return (self.W, self.b)
+
+    def zero_grad(self):
+        """Обнуляет накопленные градиенты."""
+        self.W.grad = np.zeros_like(self.W.data)
+        self.b.grad = np.zeros_like(self.b.data)
+
+    def __repr__(self):
+        """Строковое представление слоя."""
+        return (f"LinearCrossEntropyLoss({self.in_features}, {self.num_classes}, "
+                f"chunk_size={self.chunk_size}, num_samples={self.num_samples})")
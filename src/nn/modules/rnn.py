@@ -0,0 +1,434 @@
+import numpy as np
+from src.nn.parameter import Parameter
+from src.nn.module import Module
+
+
+def _sigmoid(x, out=None):
+    """Сигмоида, вычисляемая на месте в out (если передан)."""
+    out = np.negative(x, out=out)
+    np.exp(out, out=out)
+    out += 1
+    np.reciprocal(out, out=out)
+    return out
+
+
+class _RNNBase(Module):
+    """
+    Общая часть рекуррентных слоёв.
+
+    Проекция входа на все гейты для всех шагов выполняется одним умножением матриц,
+    а на каждом шаге остаётся только одно умножение на сложенную матрицу W_hh.
+    Промежуточные значения хранятся в буферах формы (seq_len, batch_size, ...),
+    которые переиспользуются между вызовами, пока не изменится форма входа.
+
+    Атрибуты:
+    ----------
+    input_size: int
+        Размерность входного вектора на одном шаге.
+    hidden_size: int
+        Размерность скрытого состояния.
+    return_sequences: bool, по умолчанию True
+        Если True, возвращаются скрытые состояния всех шагов (batch_size, seq_len, hidden_size),
+        иначе только последнее (batch_size, hidden_size).
+    stateful: bool, по умолчанию False
+        Если True, последнее состояние переносится в следующий вызов forward.
+        Градиент через границу вызовов не передаётся (truncated BPTT), поэтому длинный
+        поток можно подавать кусками фиксированной длины. Размер батча между вызовами
+        должен совпадать; перед сменой потока вызовите reset_state().
+
+    Внутри Sequential слой вызывается только с x, поэтому длины последовательностей
+    передаются заранее через set_lengths:
+
+        lstm = LSTM(16, 32)
+        model = Sequential(lstm, Linear(32, 10))
+        for data, labels, lengths in loader:    # DataLoader(..., collate_fn=pad_collate)
+            lstm.set_lengths(lengths)
+            output = model(data)
+    """
+
+    num_gates = None
+
+    def __init__(self, input_size, hidden_size, return_sequences=True, stateful=False):
+        self.input_size = input_size
+        self.hidden_size = hidden_size
+        self.return_sequences = return_sequences
+        self.stateful = stateful
+        self.W_ih = Parameter((input_size, self.num_gates * hidden_size))._init_params("kaiming")
+        self.W_hh = Parameter((hidden_size, self.num_gates * hidden_size))._init_params("kaiming")
+        self._buffers_shape = None
+        self._state = None
+        self._next_lengths = None
+
+    def reset_state(self):
+        """Сбрасывает сохранённое между вызовами состояние (для stateful=True)."""
+        self._state = None
+
+    def set_lengths(self, lengths):
+        """
+        Задаёт длины последовательностей для следующего вызова forward без аргумента lengths
+        (например, когда слой вызывается внутри Sequential). Используются один раз.
+
+        Параметры:
+        ----------
+        lengths: np.ndarray, форма (batch_size,) or None
+            Длины последовательностей без паддинга.
+        """
+        self._next_lengths = lengths
+
+    def _allocate(self, seq_len, batch_size):
+        """
+        Должен быть переопределён в подклассах. Выделяет буферы под шаги forward/backward.
+        """
+        raise NotImplementedError
+
+    def _prepare(self, x, lengths):
+        """
+        Переводит вход в порядок (seq_len, batch_size, input_size), при необходимости
+        перевыделяет буферы и строит маску шагов для последовательностей разной длины.
+        Возвращает перенесённое состояние (для stateful=True) или None.
+
+        Исключения:
+        -----------
+        ValueError
+            Если размер батча не совпадает с размером перенесённого состояния.
+        """
+        batch_size, seq_len, _ = x.shape
+        if lengths is None:
+            lengths = self._next_lengths
+        self._next_lengths = None
+        if self.stateful and self._state is not None and self._state[0].shape[0] != batch_size:
+            raise ValueError(f"Размер батча {batch_size} не совпадает с размером сохранённого состояния "
+                             f"{self._state[0].shape[0]}; вызовите reset_state() перед сменой батча")
+        if self._buffers_shape != (seq_len, batch_size):
+            self._allocate(seq_len, batch_size)
+            self._buffers_shape = (seq_len, batch_size)
+
+        self.x = np.ascontiguousarray(x.transpose(1, 0, 2))
+        if lengths is None:
+            self.mask = None
+        else:
+            lengths = np.asarray(lengths)
+            self.mask = (np.arange(seq_len)[:, None] < lengths[None, :])[:, :, None].astype(self.W_hh.data.dtype)
+        self.lengths = lengths
+
+        return self._state if self.stateful else None
+
+    def _project_input(self, bias):
+        """Проекция входа на гейты сразу для всех шагов: одно умножение (seq_len * batch_size, input_size)."""
+        seq_len, batch_size, _ = self.x.shape
+        xw = np.dot(self.x.reshape(seq_len * batch_size, self.input_size), self.W_ih.data)
+        xw += bias
+        return xw.reshape(seq_len, batch_size, -1)
+
+    def _output(self):
+        """Формирует выход слоя из буфера скрытых состояний."""
+        if self.return_sequences:
+            return self.h[1:].transpose(1, 0, 2).copy()
+        return self.h[-1].copy()
+
+    def _grad_per_step(self, grad_output):
+        """Приводит градиент по выходу к форме (seq_len, batch_size, hidden_size)."""
+        if self.return_sequences:
+            return grad_output.transpose(1, 0, 2)
+        grad = np.zeros_like(self.h[1:])
+        grad[-1] = grad_output
+        return grad
+
+    def _finish_backward(self, dA_input):
+        """
+        Накопление градиентов по W_ih одним умножением и вычисление градиента по входу.
+        """
+        seq_len, batch_size, _ = self.x.shape
+        dA_flat = dA_input.reshape(seq_len * batch_size, -1)
+        self.W_ih.grad += np.dot(self.x.reshape(seq_len * batch_size, self.input_size).T, dA_flat)
+        dx = np.dot(dA_flat, self.W_ih.data.T).reshape(seq_len, batch_size, self.input_size)
+        return dx.transpose(1, 0, 2)
+
+    def __repr__(self):
+        """Строковое представление рекуррентного слоя."""
+        return (f"{type(self).__name__}({self.input_size}, {self.hidden_size}, "
+                f"return_sequences={self.return_sequences}, stateful={self.stateful})")
+
+
+class LSTM(_RNNBase):
+    """
+    Слой LSTM. Гейты хранятся в одной матрице в порядке (i, f, o, g),
+    чтобы сигмоида применялась к одному непрерывному срезу.
+
+    Атрибуты:
+    ----------
+    W_ih: Parameter, форма (input_size, 4 * hidden_size)
+        Веса проекции входа.
+    W_hh: Parameter, форма (hidden_size, 4 * hidden_size)
+        Веса проекции скрытого состояния.
+    b: Parameter, форма (4 * hidden_size,)
+        Вектор смещений (смещение гейта забывания инициализируется единицами).
+    """
+
+    num_gates = 4
+
+    def __init__(self, input_size, hidden_size, return_sequences=True, stateful=False):
+        super().__init__(input_size, hidden_size, return_sequences, stateful)
+        self.b = Parameter((4 * hidden_size,), no_decay=True)
+        self.b.data[hidden_size:2 * hidden_size] = 1
+
+    def _allocate(self, seq_len, batch_size):
+        H = self.hidden_size
+        self.gates = np.empty((seq_len, batch_size, 4 * H))
+        self.h = np.empty((seq_len + 1, batch_size, H))
+        self.c = np.empty((seq_len + 1, batch_size, H))
+        self.tanh_c = np.empty((seq_len, batch_size, H))
+        self.dA = np.empty((seq_len, batch_size, 4 * H))
+
+    def forward(self, x, lengths=None):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray, форма (batch_size, seq_len, input_size)
+            Входные последовательности.
+        lengths: np.ndarray, форма (batch_size,), optional
+            Длины последовательностей без паддинга. На шагах паддинга состояние не меняется.
+            По умолчанию - длины, заданные set_lengths, или полная длина.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (batch_size, seq_len, hidden_size) или (batch_size, hidden_size)
+            Скрытые состояния всех шагов или только последнее.
+        """
+        state = self._prepare(x, lengths)
+        H = self.hidden_size
+        if state is None:
+            self.h[0] = 0
+            self.c[0] = 0
+        else:
+            self.h[0], self.c[0] = state
+
+        xw = self._project_input(self.b.data)
+        for t in range(xw.shape[0]):
+            a = self.gates[t]
+            np.dot(self.h[t], self.W_hh.data, out=a)
+            a += xw[t]
+            _sigmoid(a[:, :3 * H], out=a[:, :3 * H])
+            np.tanh(a[:, 3 * H:], out=a[:, 3 * H:])
+            i, f, o, g = a[:, :H], a[:, H:2 * H], a[:, 2 * H:3 * H], a[:, 3 * H:]
+
+            np.multiply(f, self.c[t], out=self.c[t + 1])
+            self.c[t + 1] += i * g
+            np.tanh(self.c[t + 1], out=self.tanh_c[t])
+            np.multiply(o, self.tanh_c[t], out=self.h[t + 1])
+
+            if self.mask is not None:
+                m = self.mask[t]
+                self.c[t + 1] = m * self.c[t + 1] + (1 - m) * self.c[t]
+                self.h[t + 1] = m * self.h[t + 1] + (1 - m) * self.h[t]
+
+        if self.stateful:
+            self._state = (self.h[-1].copy(), self.c[-1].copy())
+        return self._output()
+
+    def backward(self, grad_output):
+        """
+        Параметры:
+        ----------
+        grad_output: np.ndarray, форма (batch_size, seq_len, hidden_size) или (batch_size, hidden_size)
+            Градиент функции ошибки по выходу LSTM.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (batch_size, seq_len, input_size)
+            Градиент функции ошибки по входу LSTM.
+        """
+        H = self.hidden_size
+        grad = self._grad_per_step(grad_output)
+        dh_next = np.zeros_like(self.h[0])
+        dc_next = np.zeros_like(self.c[0])
+
+        for t in reversed(range(grad.shape[0])):
+            gates = self.gates[t]
+            i, f, o, g = gates[:, :H], gates[:, H:2 * H], gates[:, 2 * H:3 * H], gates[:, 3 * H:]
+            tanh_c = self.tanh_c[t]
+            dA = self.dA[t]
+
+            dh = dh_next + grad[t]
+            dc = dc_next + dh * o * (1 - tanh_c ** 2)
+
+            dA[:, :H] = dc * g * i * (1 - i)
+            dA[:, H:2 * H] = dc * self.c[t] * f * (1 - f)
+            dA[:, 2 * H:3 * H] = dh * tanh_c * o * (1 - o)
+            dA[:, 3 * H:] = dc * i * (1 - g ** 2)
+
+            if self.mask is None:
+                dc_next = dc * f
+                dh_next = np.dot(dA, self.W_hh.data.T)
+            else:
+                m = self.mask[t]
+                dA *= m
+                dc_next = m * dc * f + (1 - m) * dc_next
+                dh_next = np.dot(dA, self.W_hh.data.T) + (1 - m) * dh
+
+        seq_len, batch_size, _ = self.dA.shape
+        dA_flat = self.dA.reshape(seq_len * batch_size, 4 * H)
+        self.W_hh.grad += np.dot(self.h[:-1].reshape(seq_len * batch_size, H).T, dA_flat)
+        self.b.grad += dA_flat.sum(axis=0)
+        return self._finish_backward(self.dA)
+
+    def parameters(self):
+        """
+        Возвращает параметры модели.
+
+        Возвращает:
+        -----------
+        tuple[Parameter]
+            Кортеж, содержащий параметры.
+        """
+        return (self.W_ih, self.W_hh, self.b)
+
+    def zero_grad(self):
+        """Обнуляет накопленные градиенты модели."""
+        for param in self.parameters():
+            param.grad = np.zeros_like(param.data)
+
+
+class GRU(_RNNBase):
+    """
+    Слой GRU. Гейты хранятся в одной матрице в порядке (r, z, n).
+
+    Атрибуты:
+    ----------
+    W_ih: Parameter, форма (input_size, 3 * hidden_size)
+        Веса проекции входа.
+    W_hh: Parameter, форма (hidden_size, 3 * hidden_size)
+        Веса проекции скрытого состояния.
+    b_ih: Parameter, форма (3 * hidden_size,)
+        Смещения проекции входа.
+    b_hh: Parameter, форма (3 * hidden_size,)
+        Смещения проекции скрытого состояния.
+    """
+
+    num_gates = 3
+
+    def __init__(self, input_size, hidden_size, return_sequences=True, stateful=False):
+        super().__init__(input_size, hidden_size, return_sequences, stateful)
+        self.b_ih = Parameter((3 * hidden_size,), no_decay=True)
+        self.b_hh = Parameter((3 * hidden_size,), no_decay=True)
+
+    def _allocate(self, seq_len, batch_size):
+        H = self.hidden_size
+        self.gates = np.empty((seq_len, batch_size, 3 * H))
+        self.hn = np.empty((seq_len, batch_size, H))
+        self.h = np.empty((seq_len + 1, batch_size, H))
+        self.hw = np.empty((batch_size, 3 * H))
+        self.dA_input = np.empty((seq_len, batch_size, 3 * H))
+        self.dA_hidden = np.empty((seq_len, batch_size, 3 * H))
+
+    def forward(self, x, lengths=None):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray, форма (batch_size, seq_len, input_size)
+            Входные последовательности.
+        lengths: np.ndarray, форма (batch_size,), optional
+            Длины последовательностей без паддинга. На шагах паддинга состояние не меняется.
+            По умолчанию - длины, заданные set_lengths, или полная длина.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (batch_size, seq_len, hidden_size) или (batch_size, hidden_size)
+            Скрытые состояния всех шагов или только последнее.
+        """
+        state = self._prepare(x, lengths)
+        H = self.hidden_size
+        if state is None:
+            self.h[0] = 0
+        else:
+            self.h[0] = state[0]
+
+        xw = self._project_input(self.b_ih.data)
+        hw = self.hw
+        for t in range(xw.shape[0]):
+            a = self.gates[t]
+            np.dot(self.h[t], self.W_hh.data, out=hw)
+            hw += self.b_hh.data
+            self.hn[t] = hw[:, 2 * H:]
+
+            np.add(xw[t, :, :2 * H], hw[:, :2 * H], out=a[:, :2 * H])
+            _sigmoid(a[:, :2 * H], out=a[:, :2 * H])
+            r, z = a[:, :H], a[:, H:2 * H]
+            np.multiply(r, self.hn[t], out=a[:, 2 * H:])
+            a[:, 2 * H:] += xw[t, :, 2 * H:]
+            n = np.tanh(a[:, 2 * H:], out=a[:, 2 * H:])
+
+            # h' = (1 - z) * n + z * h = n + z * (h - n)
+            np.subtract(self.h[t], n, out=self.h[t + 1])
+            self.h[t + 1] *= z
+            self.h[t + 1] += n
+
+            if self.mask is not None:
+                m = self.mask[t]
+                self.h[t + 1] = m * self.h[t + 1] + (1 - m) * self.h[t]
+
+        if self.stateful:
+            self._state = (self.h[-1].copy(),)
+        return self._output()
+
+    def backward(self, grad_output):
+        """
+        Параметры:
+        ----------
+        grad_output: np.ndarray, форма (batch_size, seq_len, hidden_size) или (batch_size, hidden_size)
+            Градиент функции ошибки по выходу GRU.
+
+        Возвращает:
+        -----------
+        np.ndarray, форма (batch_size, seq_len, input_size)
+            Градиент функции ошибки по входу GRU.
+        """
+        H = self.hidden_size
+        grad = self._grad_per_step(grad_output)
+        dh_next = np.zeros_like(self.h[0])
+
+        for t in reversed(range(grad.shape[0])):
+            gates = self.gates[t]
+            r, z, n = gates[:, :H], gates[:, H:2 * H], gates[:, 2 * H:]
+            h_prev = self.h[t]
+            dA_in = self.dA_input[t]
+            dA_hid = self.dA_hidden[t]
+
+            dh = dh_next + grad[t]
+            dn = dh * (1 - z) * (1 - n ** 2)
+            dA_in[:, :H] = dn * self.hn[t] * r * (1 - r)
+            dA_in[:, H:2 * H] = dh * (h_prev - n) * z * (1 - z)
+            dA_in[:, 2 * H:] = dn
+            dA_hid[:, :2 * H] = dA_in[:, :2 * H]
+            dA_hid[:, 2 * H:] = dn * r
+
+            if self.mask is None:
+                dh_next = dh * z + np.dot(dA_hid, self.W_hh.data.T)
+            else:
+                m = self.mask[t]
+                dA_in *= m
+                dA_hid *= m
+                dh_next = m * dh * z + (1 - m) * dh + np.dot(dA_hid, self.W_hh.data.T)
+
+        seq_len, batch_size, _ = self.dA_hidden.shape
+        dA_hid_flat = self.dA_hidden.reshape(seq_len * batch_size, 3 * H)
+        self.W_hh.grad += np.dot(self.h[:-1].reshape(seq_len * batch_size, H).T, dA_hid_flat)
+        self.b_hh.grad += dA_hid_flat.sum(axis=0)
+        self.b_ih.grad += self.dA_input.reshape(seq_len * batch_size, 3 * H).sum(axis=0)
+        return self._finish_backward(self.dA_input)
+
+    def parameters(self):
+        """
+        Возвращает параметры модели.
+
+        Возвращает:
+        -----------
+        tuple[Parameter]
+            Кортеж, содержащий параметры.
+        """
+        return (self.W_ih, self.W_hh, self.b_ih, self.b_hh)
+
+    def zero_grad(self):
+        """Обнуляет накопленные градиенты модели."""
+        for param in self.parameters():
+            param.grad = np.zeros_like(param.data)
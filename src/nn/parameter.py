@@ -1,4 +1,5 @@
 import numpy as np
+from src.random import spawn_generator
 
 class Parameter:
     """
@@ -8,6 +9,10 @@ class Parameter:
     ----------
     shape: tuple or int
         Определяет размер массива параметров.
+    no_decay: bool, по умолчанию False
+        True для смещений и параметров нормализации. Учитывается только в LARS и LAMB:
+        такие параметры обновляются без weight decay и без послойной адаптации шага.
+        SGD и Adam флаг не читают.
 
     Атрибуты:
     ---------
@@ -19,16 +24,23 @@ class Parameter:
         Переменная первого момента (используется в оптимизаторах, например, Adam).
     v: np.ndarray or None
         Переменная второго момента (используется в оптимизаторах, например, Adam).
+    no_decay: bool
+        См. параметр no_decay.
+    num_members: int or None
+        Для параметров ансамбля - количество участников, сложенных по первой оси.
+        Нормы в LARS и LAMB считаются отдельно для каждого участника.
     """
 
-    def __init__(self, shape):
+    def __init__(self, shape, no_decay=False):
         self.shape = shape
         self.data = np.zeros(shape)
         self.grad = np.zeros(shape)
         self.m = None
         self.v = None
+        self.no_decay = no_decay
+        self.num_members = None
 
-    def _init_params(self, method='kaiming'):
+    def _init_params(self, method='kaiming', generator=None):
         """
         Инициализация параметров модели.
 
@@ -39,6 +51,8 @@ class Parameter:
             - 'kaiming': Инициализация Kaiming He.
             - 'zeros': Инициализация нулями.
             - 'ones': Инициализация единицами.
+        generator: np.random.Generator, optional
+            Источник случайных чисел. По умолчанию берётся новый поток из src.random.
 
         Исключения:
         -----------
@@ -47,7 +61,9 @@ class Parameter:
         """
         if method == 'kaiming':
             fan_in = self.shape[0] if isinstance(self.shape, tuple) else self.shape
-            self.data = np.random.randn(*self.shape) * np.sqrt(2 / fan_in)
+            if generator is None:
+                generator = spawn_generator()
+            self.data = generator.standard_normal(self.shape) * np.sqrt(2 / fan_in)
         elif method == 'zeros':
             self.data = np.zeros_like(self.data)
         elif method == 'ones':
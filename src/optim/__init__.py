@@ -1,2 +1,5 @@
 from src.optim.adam import Adam
+from src.optim.lamb import LAMB
+from src.optim.lars import LARS
+from src.optim.lr_scheduler import WarmupDecayLR
 from src.optim.sgd import SGD
\ No newline at end of file
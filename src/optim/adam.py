@@ -1,4 +1,5 @@
 import numpy as np
+from src.parallel import parallel_for
 
 class Adam:
     """
@@ -48,14 +49,24 @@ class Adam:
             if param.grad is None:
                 continue
 
-            if self.weight_decay != 0:
-                param.grad += self.weight_decay * param.data
+            data, grad, m, v = param.data, param.grad, self.m[i], self.v[i]
+            if all(a.flags.c_contiguous for a in (data, grad, m, v)):
+                # Плоские представления делят параметр на равные части для потоков
+                data, grad, m, v = data.reshape(-1), grad.reshape(-1), m.reshape(-1), v.reshape(-1)
 
-            self.m[i] = self.beta_1 * self.m[i] + (1 - self.beta_1) * param.grad
+            def kernel(s):
+                if self.weight_decay != 0:
+                    grad[s] += self.weight_decay * data[s]
 
-            self.v[i] = self.beta_2 * self.v[i] + (1 - self.beta_2) * (param.grad ** 2)
+                m[s] *= self.beta_1
+                m[s] += (1 - self.beta_1) * grad[s]
 
-            m_hat = self.m[i] / (1 - self.beta_1 ** self.t)
-            v_hat = self.v[i] / (1 - self.beta_2 ** self.t)
+                v[s] *= self.beta_2
+                v[s] += (1 - self.beta_2) * (grad[s] ** 2)
 
-            param.data -= self.lr * m_hat / (np.sqrt(v_hat) + self.eps)
\ No newline at end of file
+                m_hat = m[s] / (1 - self.beta_1 ** self.t)
+                v_hat = v[s] / (1 - self.beta_2 ** self.t)
+
+                data[s] -= self.lr * m_hat / (np.sqrt(v_hat) + self.eps)
+
+            parallel_for(kernel, data)
\ No newline at end of file
@@ -0,0 +1,73 @@
+import numpy as np
+from src.optim.lars import _no_decay, _norm, _trust_ratio
+
+
+class LAMB:
+    """
+    Adam с послойной адаптацией шага (Layer-wise Adaptive Moments) для обучения с большим батчем.
+
+    Шаг Adam r = m_hat / (sqrt(v_hat) + eps) + weight_decay * w масштабируется
+    для каждого параметра коэффициентом доверия ||w|| / ||r||. Исключённые параметры
+    обновляются обычным Adam без weight decay.
+
+    Атрибуты:
+    ----------
+    params: iterable
+        Итерируемый объект, содержащий параметры модели, которые нужно оптимизировать.
+    lr: float, optional, default=1e-3
+        Learning rate (скорость обучения).
+    beta_1: float, optional, default=0.9
+        Коэффициент для оценки первого момента градиентов (среднее).
+    beta_2: float, optional, default=0.999
+        Коэффициент для оценки второго момента градиентов (нецентрированная дисперсия).
+    eps: float, optional, default=1e-6
+        Малое число для предотвращения деления на ноль.
+    weight_decay: float, optional, default=0
+        Коэффициент развязанной L2-регуляризации.
+    exclude : callable, optional
+        Функция от Parameter; True - параметр не адаптируется. По умолчанию
+        исключаются параметры с флагом no_decay (смещения, gamma и beta BatchNorm).
+        Для параметров ансамбля коэффициент доверия считается для каждого участника.
+    t: int
+        Счетчик шагов оптимизации
+    """
+
+    def __init__(self, params, lr=1e-3, beta_1=0.9, beta_2=0.999, eps=1e-6, weight_decay=0, exclude=_no_decay):
+        self.params = list(params)
+        self.lr = lr
+        self.beta_1 = beta_1
+        self.beta_2 = beta_2
+        self.eps = eps
+        self.weight_decay = weight_decay
+        self.exclude = np.array([exclude(param) for param in self.params], dtype=bool)
+        self.t = 0
+        self.m = [np.zeros_like(param.data) for param in self.params]
+        self.v = [np.zeros_like(param.data) for param in self.params]
+
+    def zero_grad(self):
+        """
+        Обнуляет градиенты всех параметров.
+        """
+        for param in self.params:
+            if param is not None:
+                param.grad.fill(0)
+
+    def step(self):
+        """
+        Выполняет один шаг оптимизации LAMB.
+        """
+        self.t += 1
+        for param, m, v, excluded in zip(self.params, self.m, self.v, self.exclude):
+            m *= self.beta_1
+            m += (1 - self.beta_1) * param.grad
+            v *= self.beta_2
+            v += (1 - self.beta_2) * (param.grad ** 2)
+
+            m_hat = m / (1 - self.beta_1 ** self.t)
+            v_hat = v / (1 - self.beta_2 ** self.t)
+            update = m_hat / (np.sqrt(v_hat) + self.eps)
+            if self.weight_decay != 0 and not excluded:
+                update += self.weight_decay * param.data
+
+            ratio = 1.0 if excluded else _trust_ratio(_norm(param.data, param), _norm(update, param))
+            param.data -= (self.lr * ratio) * update
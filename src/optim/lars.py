@@ -0,0 +1,97 @@
+import numpy as np
+
+
+def _no_decay(param):
+    """По умолчанию из адаптации исключаются параметры с флагом no_decay: смещения и gamma/beta BatchNorm."""
+    return param.no_decay
+
+
+def _norm(array, param):
+    """
+    L2-норма массива array, относящегося к параметру param.
+    Для параметров ансамбля - нормы каждого участника формы (num_members, 1, ...).
+    """
+    if param.num_members is None:
+        return np.sqrt(np.vdot(array, array))
+    flat = array.reshape(param.num_members, -1)
+    return np.sqrt(np.einsum('ij,ij->i', flat, flat)).reshape((-1,) + (1,) * (array.ndim - 1))
+
+
+def _trust_ratio(weight_norm, denom, scale=1.0):
+    """scale * weight_norm / denom; 1, если одна из норм равна нулю."""
+    adapt = (weight_norm > 0) & (denom > 0)
+    return np.where(adapt, scale * weight_norm / np.where(adapt, denom, 1), 1.0)
+
+
+class LARS:
+    """
+    SGD с моментумом и послойной адаптацией скорости обучения (Layer-wise Adaptive Rate Scaling)
+    для обучения с большим батчем.
+
+    Для каждого параметра скорость обучения умножается на коэффициент доверия
+    eta * ||w|| / (||grad|| + weight_decay * ||w||). Исключённые параметры
+    обновляются обычным SGD с моментумом без weight decay.
+
+    Атрибуты:
+    ---------
+    params : iterable
+        Итерируемый объект, содержащий параметры модели, которые нужно оптимизировать.
+    lr : float, optional, default=0.1
+        Learning rate (скорость обучения).
+    momentum : float, optional, default=0.9
+        Коэффициент моментума.
+    weight_decay : float, optional, default=0
+        Коэффициент для L2-регуляризации.
+    eta : float, optional, default=0.001
+        Коэффициент доверия.
+    exclude : callable, optional
+        Функция от Parameter; True - параметр не адаптируется. По умолчанию
+        исключаются параметры с флагом no_decay (смещения, gamma и beta BatchNorm).
+        Для параметров ансамбля коэффициент доверия считается для каждого участника.
+    """
+
+    def __init__(self, params, lr=0.1, momentum=0.9, weight_decay=0, eta=0.001, exclude=_no_decay):
+        self.params = list(params)
+        self.lr = lr
+        self.momentum = momentum
+        self.weight_decay = weight_decay
+        self.eta = eta
+        self.exclude = np.array([exclude(param) for param in self.params], dtype=bool)
+        self.velocity = [np.zeros_like(param.data) for param in self.params]
+
+    def zero_grad(self):
+        """Обнуляет градиенты всех параметров."""
+        for param in self.params:
+            if param is not None:
+                param.grad.fill(0)
+
+    def trust_ratios(self):
+        """
+        Коэффициенты доверия всех параметров.
+
+        Возвращает:
+        -----------
+        list[np.ndarray]
+            Для каждого параметра - скаляр или, для параметров ансамбля,
+            массив формы (num_members, 1, ...).
+        """
+        ratios = []
+        for param, excluded in zip(self.params, self.exclude):
+            if excluded:
+                ratios.append(np.float64(1.0))
+                continue
+            weight_norm = _norm(param.data, param)
+            denom = _norm(param.grad, param) + self.weight_decay * weight_norm
+            ratios.append(_trust_ratio(weight_norm, denom, self.eta))
+        return ratios
+
+    def step(self):
+        """Выполняет один шаг оптимизации LARS."""
+        ratios = self.trust_ratios()
+        for param, velocity, ratio, excluded in zip(self.params, self.velocity, ratios, self.exclude):
+            update = param.grad
+            if self.weight_decay != 0 and not excluded:
+                update = update + self.weight_decay * param.data
+            velocity *= self.momentum
+            velocity += (self.lr * ratio) * update
+            param.data -= velocity
@@ -0,0 +1,59 @@
+import numpy as np
+
+
+class WarmupDecayLR:
+    """
+    Линейный прогрев скорости обучения с последующим затуханием.
+
+    При увеличении батча в k раз базовую скорость обычно увеличивают пропорционально
+    (для LARS/SGD) или в sqrt(k) раз (для LAMB/Adam), а прогрев не даёт большому шагу
+    разрушить модель в начале обучения.
+
+    Атрибуты:
+    ---------
+    optimizer : объект оптимизатора
+        Оптимизатор с атрибутом lr; его значение при создании считается базовым.
+    warmup_steps : int
+        Количество шагов линейного роста от 0 до базовой скорости.
+    total_steps : int
+        Общее количество шагов обучения.
+    decay : str, optional, default='cosine'
+        Вид затухания после прогрева: 'cosine', 'linear' или 'poly' (квадратичное).
+    min_lr : float, optional, default=0
+        Скорость обучения в конце обучения.
+
+    Исключения:
+    -----------
+    ValueError
+        Если указан неизвестный вид затухания.
+    """
+
+    def __init__(self, optimizer, warmup_steps, total_steps, decay='cosine', min_lr=0):
+        if decay not in ('cosine', 'linear', 'poly'):
+            raise ValueError(f"Неизвестный вид затухания: {decay}")
+        self.optimizer = optimizer
+        self.base_lr = optimizer.lr
+        self.warmup_steps = warmup_steps
+        self.total_steps = total_steps
+        self.decay = decay
+        self.min_lr = min_lr
+        self.last_step = 0
+        self.optimizer.lr = self.get_lr(0)
+
+    def get_lr(self, step):
+        """Скорость обучения на шаге step."""
+        if step < self.warmup_steps:
+            return self.base_lr * (step + 1) / self.warmup_steps
+        progress = min((step - self.warmup_steps) / max(self.total_steps - self.warmup_steps, 1), 1.0)
+        if self.decay == 'cosine':
+            factor = 0.5 * (1 + np.cos(np.pi * progress))
+        elif self.decay == 'linear':
+            factor = 1 - progress
+        else:
+            factor = (1 - progress) ** 2
+        return self.min_lr + (self.base_lr - self.min_lr) * factor
+
+    def step(self):
+        """Переходит к следующему шагу и обновляет скорость обучения оптимизатора."""
+        self.last_step += 1
+        self.optimizer.lr = self.get_lr(self.last_step)
@@ -0,0 +1,198 @@
+"""
+Общий пул потоков для параллельного выполнения независимых частей модели.
+
+NumPy отпускает GIL внутри BLAS и ufunc, поэтому независимые ветви модели
+(parallel_map) и части одного большого массива (parallel_for), обрабатываемые
+в разных потоках, выполняются одновременно.
+
+Пока ветви parallel_map выполняются одновременно, каждая вызывает BLAS в своём
+потоке. Чтобы общее число потоков не превышало число ядер, на это время BLAS
+ограничивается cpu_count // (число одновременных ветвей) потоками (если установлен
+threadpoolctl). Вне parallel_map, в том числе в ядрах parallel_for, BLAS использует
+все ядра. set_num_threads(..., blas_threads=n) задаёт постоянное ограничение вместо этого.
+"""
+import contextlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    from threadpoolctl import ThreadpoolController
+except ImportError:
+    ThreadpoolController = None
+
+_num_threads = os.cpu_count() or 1
+_min_parallel_size = 1 << 16
+_executor = None
+_blas_threads = None
+_blas_limits = None
+_controller = None
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _mark_worker():
+    _local.is_worker = True
+
+
+def set_num_threads(num_threads, blas_threads=None):
+    """
+    Задаёт количество потоков общего пула.
+
+    Параметры:
+    ----------
+    num_threads: int
+        Количество потоков. 1 - выполнять всё в вызывающем потоке.
+    blas_threads: int, optional
+        Постоянное ограничение количества потоков BLAS для всего процесса.
+        По умолчанию (None) BLAS ограничивается только на время одновременного
+        выполнения ветвей в parallel_map (см. описание модуля). Предыдущее
+        ограничение, заданное этой функцией, отменяется. Требует пакет threadpoolctl.
+
+    Исключения:
+    -----------
+    ValueError
+        Если количество потоков не положительно.
+    ImportError
+        Если передан blas_threads, а threadpoolctl не установлен.
+    """
+    global _num_threads, _executor, _blas_threads, _blas_limits
+    if num_threads < 1 or (blas_threads is not None and blas_threads < 1):
+        raise ValueError("Количество потоков должно быть положительным")
+    if blas_threads is not None and ThreadpoolController is None:
+        raise ImportError("Для blas_threads необходим пакет threadpoolctl")
+    if _blas_limits is not None:
+        _blas_limits.restore_original_limits()
+        _blas_limits = None
+    if blas_threads is not None:
+        _blas_limits = _get_controller().limit(limits=blas_threads, user_api='blas')
+    _blas_threads = blas_threads
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+        _num_threads = num_threads
+
+
+def get_num_threads():
+    """Возвращает количество потоков общего пула."""
+    return _num_threads
+
+
+def get_blas_threads():
+    """Возвращает постоянное ограничение потоков BLAS, заданное set_num_threads, или None."""
+    return _blas_threads
+
+
+def _get_controller():
+    global _controller
+    if _controller is None:
+        _controller = ThreadpoolController()
+    return _controller
+
+
+def _limit_blas(num_branches):
+    """Ограничивает BLAS на время одновременного выполнения num_branches ветвей."""
+    if _blas_threads is not None or ThreadpoolController is None:
+        return contextlib.nullcontext()
+    concurrent = min(num_branches, _num_threads)
+    return _get_controller().limit(limits=max(1, (os.cpu_count() or 1) // concurrent), user_api='blas')
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_num_threads, initializer=_mark_worker)
+        return _executor
+
+
+def parallel_map(fn, items):
+    """
+    Применяет fn к каждому элементу items в общем пуле потоков.
+
+    Первый элемент обрабатывается в вызывающем потоке. Вызовы изнутри пула
+    (вложенные контейнеры) выполняются последовательно, чтобы не занимать потоки
+    ожиданием друг друга. На время выполнения BLAS ограничивается (см. описание модуля).
+
+    Параметры:
+    ----------
+    fn: callable
+        Функция одного аргумента.
+    items: list
+        Аргументы.
+
+    Возвращает:
+    -----------
+    list
+        Результаты в порядке items.
+    """
+    items = list(items)
+    if len(items) <= 1 or _num_threads == 1 or getattr(_local, 'is_worker', False):
+        return [fn(item) for item in items]
+    with _limit_blas(len(items)):
+        return _map(fn, items)
+
+
+def _map(fn, items):
+    """Выполняет fn для всех items в пуле; первый элемент - в вызывающем потоке."""
+    executor = _get_executor()
+    futures = [executor.submit(fn, item) for item in items[1:]]
+    first = fn(items[0])
+    return [first] + [future.result() for future in futures]
+
+
+def set_min_parallel_size(min_size):
+    """
+    Задаёт минимальное количество элементов на один поток в parallel_for.
+    Массивы меньше 2 * min_size обрабатываются в вызывающем потоке.
+
+    Исключения:
+    -----------
+    ValueError
+        Если min_size меньше 1.
+    """
+    global _min_parallel_size
+    if min_size < 1:
+        raise ValueError("Минимальный размер части должен быть не меньше 1")
+    _min_parallel_size = min_size
+
+
+def get_min_parallel_size():
+    """Возвращает минимальное количество элементов на один поток в parallel_for."""
+    return _min_parallel_size
+
+
+def _split(length, size):
+    """Делит [0, length) на отрезки по числу потоков с учётом порога размера."""
+    num_chunks = min(_num_threads, length, size // _min_parallel_size)
+    if num_chunks < 2 or getattr(_local, 'is_worker', False):
+        return [slice(None)]
+    bounds = np.linspace(0, length, num_chunks + 1).astype(int)
+    return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def parallel_for(fn, x):
+    """
+    Делит массив x по первой оси на части и вызывает fn(slice) для каждой части
+    в общем пуле потоков. Маленькие массивы обрабатываются одним вызовом fn(slice(None)).
+
+    Параметры:
+    ----------
+    fn: callable
+        Функция от среза по первой оси.
+    x: np.ndarray
+        Массив, определяющий разбиение.
+
+    Возвращает:
+    -----------
+    list
+        Результаты fn для каждой части.
+    """
+    chunks = _split(len(x), x.size)
+    if len(chunks) == 1:
+        return [fn(chunks[0])]
+    # Ядра parallel_for не вызывают BLAS, поэтому ограничение не нужно
+    return _map(fn, chunks)
@@ -0,0 +1,62 @@
+"""
+Источники случайных чисел на основе np.random.Generator с генератором Philox.
+
+Все потоки выводятся из одного корневого зерна, заданного manual_seed:
+- spawn_generator() выдаёт новый независимый поток при каждом вызове; модули
+  (инициализация параметров, Dropout, DataLoader) берут свой поток при создании,
+  поэтому результат зависит только от зерна и порядка создания модулей;
+- get_generator(*key) выдаёт поток по ключу (например, номер эпохи и шарда), который
+  не зависит от порядка вызовов и количества воркеров или процессов.
+"""
+import numpy as np
+
+_root = np.random.SeedSequence()
+_spawned = 0
+
+
+def manual_seed(seed):
+    """
+    Задаёт корневое зерно для всех последующих потоков случайных чисел.
+
+    Параметры:
+    ----------
+    seed: int
+        Корневое зерно.
+    """
+    global _root, _spawned
+    _root = np.random.SeedSequence(seed)
+    _spawned = 0
+
+
+def _make_generator(seed_sequence):
+    return np.random.Generator(np.random.Philox(seed_sequence))
+
+
+def spawn_generator():
+    """
+    Возвращает новый независимый поток, следующий по порядку от корневого зерна.
+
+    Возвращает:
+    -----------
+    np.random.Generator
+    """
+    global _spawned
+    seed_sequence = np.random.SeedSequence(_root.entropy, spawn_key=_root.spawn_key + (0, _spawned))
+    _spawned += 1
+    return _make_generator(seed_sequence)
+
+
+def get_generator(*key):
+    """
+    Возвращает поток, однозначно определяемый корневым зерном и ключом.
+
+    Параметры:
+    ----------
+    *key: int
+        Неотрицательные целые числа, например (эпоха, номер шарда).
+
+    Возвращает:
+    -----------
+    np.random.Generator
+    """
+    return _make_generator(np.random.SeedSequence(_root.entropy, spawn_key=_root.spawn_key + (1,) + key))
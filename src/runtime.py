@@ -0,0 +1,134 @@
+"""
+Минимальная среда выполнения замороженных моделей (см. src.utils.export.freeze).
+
+Зависит только от NumPy и стандартной библиотеки: не импортирует модули обучения,
+не создаёт объекты Module и Parameter, а веса отображает в память из файла
+без копирования. Файл можно скопировать отдельно от пакета.
+
+Формат файла:
+    8 байт     - сигнатура MAGIC
+    8 байт     - длина заголовка (uint64, little-endian)
+    заголовок  - JSON: версия, список операций и описание тензоров
+    данные     - с ближайшей границы ALIGNMENT байт; смещения тензоров в заголовке
+                 отсчитываются от начала данных и также выровнены
+"""
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"NNFROZEN"
+VERSION = 1
+ALIGNMENT = 64
+
+
+def _align(size):
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _relu(x, owned):
+    return np.maximum(x, 0, out=x if owned else None)
+
+
+def _sigmoid(x, owned):
+    out = np.negative(x, out=x if owned else None)
+    np.exp(out, out=out)
+    out += 1
+    return np.reciprocal(out, out=out)
+
+
+def _tanh(x, owned):
+    return np.tanh(x, out=x if owned else None)
+
+
+_ACTIVATIONS = {"relu": _relu, "sigmoid": _sigmoid, "tanh": _tanh}
+
+
+class FrozenModel:
+    """
+    Замороженная модель: плоский список операций над весами, отображёнными в память.
+
+    Атрибуты:
+    ----------
+    ops: list[dict]
+        Операции в порядке выполнения.
+    tensors: list[np.ndarray]
+        Веса (только для чтения).
+    """
+
+    def __init__(self, ops, tensors):
+        self.ops = ops
+        self.tensors = tensors
+
+    def __call__(self, x):
+        """
+        Параметры:
+        ----------
+        x: np.ndarray, форма (batch_size, in_features)
+            Входные данные.
+
+        Возвращает:
+        -----------
+        np.ndarray
+            Выход модели.
+        """
+        x = np.asarray(x)
+        owned = False
+        for op in self.ops:
+            kind = op["op"]
+            if kind == "linear":
+                x = np.dot(x, self.tensors[op["W"]])
+                if op["b"] is not None:
+                    x += self.tensors[op["b"]]
+                owned = True
+            elif kind == "affine":
+                x = x * self.tensors[op["scale"]]
+                x += self.tensors[op["shift"]]
+                owned = True
+            elif kind == "scale":
+                x = np.multiply(x, op["value"], out=x if owned else None)
+                owned = True
+            else:
+                x = _ACTIVATIONS[kind](x, owned)
+                owned = True
+        return x
+
+    def __repr__(self):
+        return f"FrozenModel({', '.join(op['op'] for op in self.ops)})"
+
+
+def load(path):
+    """
+    Загружает замороженную модель, отображая веса в память.
+
+    Параметры:
+    ----------
+    path: str
+        Путь к файлу, созданному src.utils.export.freeze.
+
+    Возвращает:
+    -----------
+    FrozenModel
+
+    Исключения:
+    -----------
+    ValueError
+        Если файл не является замороженной моделью или имеет неподдерживаемую версию.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} не является замороженной моделью")
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+    if header["version"] != VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {header['version']}")
+
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    data_start = _align(len(MAGIC) + 8 + header_size)
+    tensors = []
+    for spec in header["tensors"]:
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        tensor = np.frombuffer(data, dtype=dtype, count=count, offset=data_start + spec["offset"])
+        tensors.append(tensor.reshape(spec["shape"]))
+    return FrozenModel(header["ops"], tensors)
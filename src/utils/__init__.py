@@ -1 +1,3 @@
-from src.utils import data
\ No newline at end of file
+from src.utils import data
+from src.utils.autotune import autotune, AutotuneResult
+from src.utils.export import freeze
\ No newline at end of file
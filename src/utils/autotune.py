@@ -0,0 +1,237 @@
+import copy
+import hashlib
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+from src import parallel
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "numpy_network", "autotune.json")
+
+
+class AutotuneResult:
+    """
+    Результат подбора конфигурации обучения.
+
+    Атрибуты:
+    ----------
+    batch_size: int
+        Лучший размер батча.
+    num_threads: int
+        Лучшее количество потоков пула src.parallel.
+    blas_threads: int or None
+        Лучшее количество потоков BLAS (None, если threadpoolctl не установлен).
+    samples_per_sec: float
+        Пропускная способность на лучшей конфигурации.
+    peak_memory: int
+        Пиковая память одного шага обучения в байтах.
+    trials: list[dict]
+        Все измеренные конфигурации.
+    cached: bool
+        True, если результат взят из кэша.
+    """
+
+    def __init__(self, batch_size, num_threads, samples_per_sec, peak_memory, trials, blas_threads=None,
+                 cached=False):
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.blas_threads = blas_threads
+        self.samples_per_sec = samples_per_sec
+        self.peak_memory = peak_memory
+        self.trials = trials
+        self.cached = cached
+
+    def apply(self):
+        """Устанавливает найденное количество потоков пула и BLAS."""
+        parallel.set_num_threads(self.num_threads, blas_threads=self.blas_threads)
+
+    def to_dict(self):
+        return {
+            "batch_size": self.batch_size,
+            "num_threads": self.num_threads,
+            "blas_threads": self.blas_threads,
+            "samples_per_sec": self.samples_per_sec,
+            "peak_memory": self.peak_memory,
+            "trials": self.trials,
+        }
+
+    def __repr__(self):
+        return (f"AutotuneResult(batch_size={self.batch_size}, num_threads={self.num_threads}, "
+                f"blas_threads={self.blas_threads}, "
+                f"samples_per_sec={self.samples_per_sec:.1f}, peak_memory={self.peak_memory}, cached={self.cached})")
+
+
+def _default_thread_counts():
+    cpu_count = os.cpu_count() or 1
+    counts = {cpu_count}
+    n = 1
+    while n < cpu_count:
+        counts.add(n)
+        n *= 2
+    return tuple(sorted(counts))
+
+
+def _thread_pairs(thread_counts, blas_thread_counts):
+    """
+    Пары (потоки пула, потоки BLAS), у которых произведение не превышает число ядер.
+    Пары с одним потоком BLAS допускаются всегда, чтобы каждый кандидат пула был проверен.
+    """
+    if parallel.ThreadpoolController is None:
+        return [(num_threads, None) for num_threads in thread_counts]
+    cpu_count = os.cpu_count() or 1
+    return [(num_threads, blas_threads)
+            for num_threads in thread_counts
+            for blas_threads in blas_thread_counts
+            if num_threads * blas_threads <= cpu_count or blas_threads == 1]
+
+
+def _cache_key(model, loss_fn, optimizer, x, batch_sizes, thread_pairs, memory_budget):
+    """Ключ кэша: архитектура модели, функция потерь, оптимизатор, вход, кандидаты и машина."""
+    signature = json.dumps([
+        repr(model),
+        getattr(loss_fn, "__name__", repr(loss_fn)),
+        type(optimizer).__name__,
+        list(x.shape[1:]),
+        str(x.dtype),
+        list(batch_sizes),
+        [list(pair) for pair in thread_pairs],
+        memory_budget,
+        platform.node(),
+        platform.machine(),
+        os.cpu_count(),
+        np.__version__,
+    ])
+    return hashlib.sha1(signature.encode()).hexdigest()
+
+
+def _load_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path, cache):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(cache, f, indent=2)
+
+
+def _train_step(model, loss_fn, optimizer, x, y):
+    optimizer.zero_grad()
+    loss = loss_fn(model(x), y)
+    loss.backward()
+    optimizer.step()
+
+
+def autotune(model, loss_fn, optimizer, x, y, batch_sizes=(32, 64, 128, 256, 512, 1024), thread_counts=None,
+             blas_thread_counts=None, memory_budget=None, steps=5, warmup=1, cache_path=DEFAULT_CACHE_PATH):
+    """
+    Подбирает размер батча и количество потоков с максимальной пропускной способностью обучения.
+
+    Потоки пула src.parallel и потоки BLAS перебираются парами, произведение которых
+    не превышает число ядер (потоки BLAS - только если установлен threadpoolctl).
+
+    Для каждой конфигурации выполняется несколько коротких шагов обучения на копии
+    модели и оптимизатора, поэтому исходные параметры и состояние оптимизатора
+    не меняются. Результат сохраняется в кэш по сигнатуре модели и машины,
+    и при повторном вызове поиск не выполняется.
+
+    Параметры:
+    ----------
+    model: Sequential
+        Модель.
+    loss_fn: callable
+        Функция потерь, например CrossEntropyLoss.
+    optimizer: объект оптимизатора
+        Оптимизатор, созданный по параметрам model (SGD, Adam).
+    x: np.ndarray, форма (num_samples, ...)
+        Пример входных данных; батчи нужного размера набираются из него по кругу.
+    y: np.ndarray, форма (num_samples,)
+        Метки для x.
+    batch_sizes: tuple[int]
+        Кандидаты размера батча.
+    thread_counts: tuple[int], optional
+        Кандидаты количества потоков пула. По умолчанию степени двойки до числа ядер.
+    blas_thread_counts: tuple[int], optional
+        Кандидаты количества потоков BLAS. По умолчанию степени двойки до числа ядер.
+    memory_budget: int, optional
+        Ограничение пиковой памяти шага обучения в байтах.
+    steps: int, по умолчанию 5
+        Количество измеряемых шагов на конфигурацию.
+    warmup: int, по умолчанию 1
+        Количество шагов прогрева перед измерением.
+    cache_path: str or None
+        Путь к файлу кэша. None - не использовать кэш.
+
+    Возвращает:
+    -----------
+    AutotuneResult
+        Лучшая конфигурация и все измерения.
+
+    Исключения:
+    -----------
+    ValueError
+        Если ни одна конфигурация не укладывается в memory_budget.
+    """
+    thread_counts = tuple(thread_counts) if thread_counts is not None else _default_thread_counts()
+    blas_thread_counts = tuple(blas_thread_counts) if blas_thread_counts is not None else _default_thread_counts()
+    thread_pairs = _thread_pairs(thread_counts, blas_thread_counts)
+    batch_sizes = tuple(sorted(batch_sizes))
+
+    key = _cache_key(model, loss_fn, optimizer, x, batch_sizes, thread_pairs, memory_budget)
+    if cache_path is not None:
+        cached = _load_cache(cache_path).get(key)
+        if cached is not None:
+            return AutotuneResult(cached=True, **cached)
+
+    model, loss_fn, optimizer = copy.deepcopy((model, loss_fn, optimizer))
+    model.train()
+    initial_threads = parallel.get_num_threads()
+    initial_blas_threads = parallel.get_blas_threads()
+    trials = []
+    try:
+        for batch_size in batch_sizes:
+            idx = np.arange(batch_size) % len(x)
+            xb, yb = x[idx], y[idx]
+
+            tracemalloc.start()
+            _train_step(model, loss_fn, optimizer, xb, yb)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if memory_budget is not None and peak_memory > memory_budget:
+                # Память растёт с размером батча, большие размеры можно не проверять
+                break
+
+            for num_threads, blas_threads in thread_pairs:
+                parallel.set_num_threads(num_threads, blas_threads=blas_threads)
+                for _ in range(warmup):
+                    _train_step(model, loss_fn, optimizer, xb, yb)
+                start = time.perf_counter()
+                for _ in range(steps):
+                    _train_step(model, loss_fn, optimizer, xb, yb)
+                elapsed = time.perf_counter() - start
+                trials.append({
+                    "batch_size": batch_size,
+                    "num_threads": num_threads,
+                    "blas_threads": blas_threads,
+                    "samples_per_sec": batch_size * steps / elapsed,
+                    "peak_memory": peak_memory,
+                })
+    finally:
+        parallel.set_num_threads(initial_threads, blas_threads=initial_blas_threads)
+
+    if not trials:
+        raise ValueError("Ни одна конфигурация не укладывается в memory_budget")
+
+    best = max(trials, key=lambda trial: trial["samples_per_sec"])
+    result = AutotuneResult(trials=trials, **best)
+    if cache_path is not None:
+        cache = _load_cache(cache_path)
+        cache[key] = result.to_dict()
+        _save_cache(cache_path, cache)
+    return result
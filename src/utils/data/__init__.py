@@ -1 +1,3 @@
-from src.utils.data.dataloader import DataLoader
\ No newline at end of file
+from src.utils.data.dataloader import DataLoader
+from src.utils.data.iterable import IterableDataLoader
+from src.utils.data.sampler import BucketBatchSampler, pad_collate
\ No newline at end of file
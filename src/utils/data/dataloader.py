@@ -1,4 +1,5 @@
 import numpy as np
+from src.random import spawn_generator
 
 class DataLoader:
     """
@@ -16,20 +17,38 @@ class DataLoader:
     is_train : bool, optional, default=True
         Если True, перед выдачей батчей перемешивает датасет.
         Если False, данные не перемешиваются.
+
+    batch_sampler : iterable, optional, default=None
+        Источник батчей индексов (например, BucketBatchSampler). Если задан,
+        batch_size, shuffle и drop_last не используются.
+
+    collate_fn : callable, optional, default=None
+        Функция сборки списка пар (вектор, метка) в батч (например, pad_collate
+        для последовательностей разной длины).
+
+    generator : np.random.Generator, optional, default=None
+        Источник случайных чисел для перемешивания. По умолчанию берётся новый поток из src.random.
     """
 
-    def __init__(self, dataset, batch_size=128, shuffle=False, drop_last=False):
+    def __init__(self, dataset, batch_size=128, shuffle=False, drop_last=False, batch_sampler=None, collate_fn=None,
+                 generator=None):
         self.dataset = dataset  # Датасет
         self.batch_size = batch_size  # Размер батча
         self.shuffle = shuffle  # Режим обучения (перемешивание данных)
         self.drop_last = drop_last
+        self.batch_sampler = batch_sampler
+        self.collate_fn = collate_fn
+        self.generator = generator if generator is not None else spawn_generator()
 
         self.init_array()
 
     def init_array(self):
+        if self.batch_sampler is not None:
+            self.array = list(self.batch_sampler)
+            return self.array
         self.array = list(range(len(self.dataset)))
         if self.shuffle:
-            np.random.shuffle(self.array)
+            self.generator.shuffle(self.array)
         return self.array
 
     def __iter__(self):
@@ -42,6 +61,8 @@ class DataLoader:
         """
         Возвращает количество батчей в датасете.
         """
+        if self.batch_sampler is not None:
+            return len(self.batch_sampler)
         return int(np.ceil(len(self.dataset) / self.batch_size))
 
     def __next__(self):
@@ -64,6 +85,10 @@ class DataLoader:
             self.init_array()
             raise StopIteration()  # Если данные закончились, завершаем итерацию
 
+        if self.batch_sampler is not None:
+            selected = self.array.pop(0)
+            return self._collate(selected)
+
         if len(self.array) < self.batch_size and self.drop_last:
             self.init_array()
             raise StopIteration()
@@ -76,6 +101,15 @@ class DataLoader:
             selected = self.array  # Берём оставшиеся элементы
             self.array = []  # Очищаем массив индексов
 
+        return self._collate(selected)
+
+    def _collate(self, selected):
+        """
+        Собирает данные и метки для выбранных индексов.
+        """
+        if self.collate_fn is not None:
+            return self.collate_fn([self.dataset[ind] for ind in selected])
+
         # Собираем данные и метки для текущего батча
         data = [self.dataset[ind][0] for ind in selected]
         labels = [self.dataset[ind][1] for ind in selected]
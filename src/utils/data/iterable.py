@@ -0,0 +1,241 @@
+import queue
+import threading
+
+import numpy as np
+from src.random import spawn_generator
+
+_END = object()
+# Как часто поток чтения проверяет флаг остановки, пока очередь заполнена (секунды)
+_POLL_INTERVAL = 0.1
+
+
+def _open(source):
+    """Возвращает итератор по источнику: вызывает его, если это функция-генератор."""
+    return iter(source() if callable(source) else source)
+
+
+def _close(iterator):
+    """Закрывает итератор (генератор), если он это поддерживает."""
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+def _put(buffer, item, stop):
+    """Кладёт item в очередь, пока не установлен stop. Возвращает False при остановке."""
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_shard(source, buffer, stop):
+    """
+    Читает шард в ограниченную очередь (выполняется в отдельном потоке).
+    Завершается при установке stop и закрывает источник.
+    """
+    iterator = None
+    try:
+        iterator = _open(source)
+        for sample in iterator:
+            if not _put(buffer, sample, stop):
+                return
+        _put(buffer, (_END, None), stop)
+    except BaseException as error:
+        _put(buffer, (_END, error), stop)
+    finally:
+        if iterator is not None:
+            _close(iterator)
+
+
+def _interleave(iterators):
+    """Поочерёдно берёт по одному элементу из каждого итератора, пока все не закончатся."""
+    active = list(iterators)
+    try:
+        while active:
+            for it in list(active):
+                try:
+                    yield next(it)
+                except StopIteration:
+                    active.remove(it)
+    finally:
+        for it in active:
+            _close(it)
+
+
+def _chain(first, stream):
+    """Поток, начинающийся с уже прочитанного первого элемента."""
+    yield first
+    yield from stream
+
+
+def _threaded(source, prefetch):
+    """
+    Итератор по шарду, который заранее читается в отдельном потоке.
+    При закрытии итератора (например, выход из цикла) поток чтения останавливается.
+    """
+    buffer = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_shard, args=(source, buffer, stop), daemon=True)
+    reader.start()
+    try:
+        while True:
+            sample = buffer.get()
+            if isinstance(sample, tuple) and len(sample) == 2 and sample[0] is _END:
+                if sample[1] is not None:
+                    raise sample[1]
+                return
+            yield sample
+    finally:
+        stop.set()
+        reader.join()
+
+
+class IterableDataLoader:
+    """
+    Загрузчик батчей из потока данных без длины и случайного доступа.
+
+    Примеры читаются из генератора по одному и складываются в заранее выделенные
+    массивы, поэтому расход памяти постоянен и не зависит от размера потока.
+    Перемешивание выполняется через буфер фиксированного размера: на каждый батч
+    из буфера выбираются batch_size случайных элементов, а их места занимают новые
+    примеры из потока.
+
+    ---------
+    Параметры
+    ---------
+    dataset : iterable или callable, optional
+        Источник пар (вектор, метка). Если передана функция, она вызывается в начале
+        каждой эпохи и должна вернуть итератор (например, функция-генератор).
+
+    batch_size : int, optional, default=128
+        Размер батча.
+
+    shuffle_buffer_size : int, optional, default=0
+        Размер буфера перемешивания. 0 - без перемешивания.
+
+    drop_last : bool, optional, default=False
+        Отбрасывать ли последний неполный батч.
+
+    shards : list, optional
+        Список источников вместо dataset. Шарды читаются поочерёдно по одному примеру,
+        поэтому порядок не зависит от parallel_readers.
+
+    parallel_readers : bool, optional, default=False
+        Если True, каждый шард читается заранее в отдельном потоке.
+
+    prefetch : int, optional, default=256
+        Максимальное количество заранее прочитанных примеров на один шард.
+
+    generator : np.random.Generator, optional, default=None
+        Источник случайных чисел для перемешивания. По умолчанию берётся новый поток из src.random.
+
+    Исключения:
+    -----------
+    ValueError
+        Если не передан ровно один из dataset и shards или буфер перемешивания меньше батча.
+
+    Примечание:
+    -----------
+    Массивы батча переиспользуются: данные батча действительны до получения следующего.
+    """
+
+    def __init__(self, dataset=None, batch_size=128, shuffle_buffer_size=0, drop_last=False, shards=None,
+                 parallel_readers=False, prefetch=256, generator=None):
+        if (dataset is None) == (shards is None):
+            raise ValueError("Нужно передать ровно один из параметров dataset и shards")
+        if 0 < shuffle_buffer_size < batch_size:
+            raise ValueError("Размер буфера перемешивания должен быть не меньше размера батча")
+        self.sources = [dataset] if shards is None else list(shards)
+        self.batch_size = batch_size
+        self.shuffle_buffer_size = shuffle_buffer_size
+        self.drop_last = drop_last
+        self.parallel_readers = parallel_readers
+        self.prefetch = prefetch
+        self.generator = generator if generator is not None else spawn_generator()
+
+    def _stream(self):
+        """Общий поток примеров из всех источников."""
+        if self.parallel_readers:
+            iterators = [_threaded(source, self.prefetch) for source in self.sources]
+        else:
+            iterators = [_open(source) for source in self.sources]
+        if len(iterators) == 1:
+            return iterators[0]
+        return _interleave(iterators)
+
+    @staticmethod
+    def _allocate(size, sample):
+        """Выделяет массивы под size примеров по форме первого примера."""
+        x, label = np.asarray(sample[0]), np.asarray(sample[1])
+        return (np.empty((size,) + x.shape, dtype=np.float32),
+                np.empty((size,) + label.shape, dtype=label.dtype))
+
+    def __iter__(self):
+        """
+        Возвращает итератор по батчам (data, labels) одной эпохи.
+        """
+        stream = self._stream()
+        try:
+            yield from self._batches(stream)
+        finally:
+            # Досрочный выход из цикла закрывает источники и останавливает потоки чтения
+            _close(stream)
+
+    def _batches(self, stream):
+        """Батчи из потока примеров."""
+        try:
+            first = next(stream)
+        except StopIteration:
+            return
+
+        batch_x, batch_y = self._allocate(self.batch_size, first)
+        buffer_size = self.shuffle_buffer_size
+        if buffer_size:
+            buffer_x, buffer_y = self._allocate(buffer_size, first)
+            # Место для новых примеров, которые заменят выбранные в батч
+            stage_x, stage_y = self._allocate(self.batch_size, first)
+        else:
+            buffer_x, buffer_y = batch_x, batch_y
+            stage_x, stage_y = batch_x, batch_y
+            buffer_size = 0
+
+        filled = 0
+        staged = 0
+        for sample in _chain(first, stream):
+            if filled < buffer_size:
+                buffer_x[filled], buffer_y[filled] = sample
+                filled += 1
+                continue
+
+            stage_x[staged], stage_y[staged] = sample
+            staged += 1
+            if staged < self.batch_size:
+                continue
+            staged = 0
+
+            if buffer_size:
+                idx = self.generator.choice(buffer_size, self.batch_size, replace=False)
+                np.take(buffer_x, idx, axis=0, out=batch_x)
+                np.take(buffer_y, idx, axis=0, out=batch_y)
+                buffer_x[idx] = stage_x
+                buffer_y[idx] = stage_y
+            yield batch_x, batch_y
+
+        # Конец потока: перемешиваем остаток буфера вместе с недобранными примерами
+        if buffer_size:
+            rest_x = np.concatenate([buffer_x[:filled], stage_x[:staged]])
+            rest_y = np.concatenate([buffer_y[:filled], stage_y[:staged]])
+            order = self.generator.permutation(len(rest_x))
+            rest_x, rest_y = rest_x[order], rest_y[order]
+        else:
+            rest_x, rest_y = batch_x[:staged], batch_y[:staged]
+
+        for start in range(0, len(rest_x), self.batch_size):
+            end = start + self.batch_size
+            if end > len(rest_x) and self.drop_last:
+                break
+            yield rest_x[start:end], rest_y[start:end]
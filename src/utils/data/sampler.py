@@ -0,0 +1,104 @@
+import numpy as np
+from src.random import spawn_generator
+
+
+class BucketBatchSampler:
+    """
+    Сэмплер батчей, группирующий последовательности близкой длины.
+
+    Индексы перемешиваются, делятся на корзины по batch_size * bucket_size элементов,
+    внутри корзины сортируются по длине и режутся на батчи. Так в одном батче
+    оказываются последовательности почти одинаковой длины и на паддинг почти
+    не тратятся вычисления. Порядок батчей также перемешивается.
+
+    ---------
+    Параметры
+    ---------
+    lengths : list или np.ndarray
+        Длины элементов датасета.
+
+    batch_size : int, optional, default=128
+        Размер батча.
+
+    bucket_size : int, optional, default=50
+        Количество батчей в одной корзине.
+
+    shuffle : bool, optional, default=True
+        Перемешивать ли элементы и порядок батчей.
+
+    drop_last : bool, optional, default=False
+        Отбрасывать ли неполные батчи.
+
+    generator : np.random.Generator, optional, default=None
+        Источник случайных чисел. По умолчанию берётся новый поток из src.random.
+    """
+
+    def __init__(self, lengths, batch_size=128, bucket_size=50, shuffle=True, drop_last=False, generator=None):
+        self.lengths = np.asarray(lengths)
+        self.batch_size = batch_size
+        self.bucket_size = bucket_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.generator = generator if generator is not None else spawn_generator()
+
+    def __iter__(self):
+        """
+        Возвращает итератор по батчам индексов.
+        """
+        indices = np.arange(len(self.lengths))
+        if self.shuffle:
+            self.generator.shuffle(indices)
+
+        chunk = self.batch_size * self.bucket_size
+        batches = []
+        for start in range(0, len(indices), chunk):
+            bucket = indices[start:start + chunk]
+            bucket = bucket[np.argsort(self.lengths[bucket], kind='stable')]
+            for i in range(0, len(bucket), self.batch_size):
+                batch = bucket[i:i + self.batch_size]
+                if len(batch) < self.batch_size and self.drop_last:
+                    continue
+                batches.append(batch.tolist())
+
+        if self.shuffle:
+            self.generator.shuffle(batches)
+        return iter(batches)
+
+    def __len__(self):
+        """
+        Возвращает количество батчей.
+        """
+        num_buckets, last = divmod(len(self.lengths), self.batch_size * self.bucket_size)
+        count = num_buckets * self.bucket_size
+        if self.drop_last:
+            return count + last // self.batch_size
+        return count + int(np.ceil(last / self.batch_size))
+
+
+def pad_collate(batch, padding_value=0.0):
+    """
+    Собирает батч последовательностей разной длины в один массив с паддингом.
+
+    Параметры:
+    ----------
+    batch : list
+        Список пар (последовательность формы (seq_len, num_features), метка).
+    padding_value : float, optional, default=0.0
+        Значение для заполнения.
+
+    Возвращает:
+    -----------
+    data : np.ndarray, форма (batch_size, max_len, num_features)
+        Последовательности, дополненные до максимальной длины в батче.
+    labels : np.ndarray
+        Метки.
+    lengths : np.ndarray, форма (batch_size,)
+        Исходные длины последовательностей.
+    """
+    sequences = [np.asarray(item[0], dtype=np.float32) for item in batch]
+    lengths = np.array([len(seq) for seq in sequences])
+    data = np.full((len(sequences), lengths.max()) + sequences[0].shape[1:], padding_value, dtype=np.float32)
+    for i, seq in enumerate(sequences):
+        data[i, :len(seq)] = seq
+    labels = np.array([item[1] for item in batch])
+    return data, labels, lengths
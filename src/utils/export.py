@@ -0,0 +1,136 @@
+import json
+import struct
+
+import numpy as np
+from src import runtime
+from src.nn.modules.activation import ReLU, Sigmoid, Tanh
+from src.nn.modules.batchnorm import BatchNorm
+from src.nn.modules.container import Sequential
+from src.nn.modules.dropout import Dropout
+from src.nn.modules.linear import Linear
+
+_ACTIVATIONS = {ReLU: "relu", Sigmoid: "sigmoid", Tanh: "tanh"}
+
+
+def _flatten(modules):
+    for module in modules:
+        if isinstance(module, Sequential):
+            yield from _flatten(module.modules)
+        else:
+            yield module
+
+
+def _build_ops(model, dtype):
+    """
+    Переводит модель в плоский список операций режима инференса.
+
+    BatchNorm и масштабирование Dropout встраиваются в веса соседнего Linear:
+    предыдущего, если они идут сразу после него, иначе следующего.
+    """
+    ops = []
+    tensors = []
+
+    def add(array):
+        tensors.append(np.ascontiguousarray(array, dtype=dtype))
+        return len(tensors) - 1
+
+    # Последний Linear хранится в изменяемом виде, пока к его выходу можно что-то встроить
+    pending_linear = None
+    # Покомпонентное преобразование x * scale + shift, ожидающее следующий Linear
+    pending_affine = None
+
+    def flush():
+        nonlocal pending_linear, pending_affine
+        if pending_linear is not None:
+            W, b = pending_linear
+            ops.append({"op": "linear", "W": add(W), "b": None if b is None else add(b)})
+            pending_linear = None
+        if pending_affine is not None:
+            scale, shift = pending_affine
+            if np.ndim(scale) == 0 and np.ndim(shift) == 0 and shift == 0:
+                ops.append({"op": "scale", "value": float(scale)})
+            else:
+                ops.append({"op": "affine", "scale": add(np.broadcast_to(scale, np.shape(shift) or np.shape(scale))),
+                            "shift": add(np.broadcast_to(shift, np.shape(scale) or np.shape(shift)))})
+            pending_affine = None
+
+    def affine(scale, shift):
+        nonlocal pending_linear, pending_affine
+        if pending_linear is not None:
+            W, b = pending_linear
+            pending_linear = (W * scale, (b * scale if b is not None else 0) + shift)
+        elif pending_affine is not None:
+            prev_scale, prev_shift = pending_affine
+            pending_affine = (prev_scale * scale, prev_shift * scale + shift)
+        else:
+            pending_affine = (scale, shift)
+
+    for module in _flatten([model]):
+        if isinstance(module, Linear):
+            if pending_linear is not None:
+                flush()
+            W, b = module.W.data.copy(), module.b.data.copy() if module.bias else None
+            if pending_affine is not None:
+                scale, shift = pending_affine
+                pending_affine = None
+                b = (b if b is not None else 0) + np.dot(np.broadcast_to(shift, W.shape[:1]), W)
+                W = W * np.reshape(scale, (-1, 1)) if np.ndim(scale) else W * scale
+            pending_linear = (W, b)
+        elif isinstance(module, BatchNorm):
+            scale = module.gamma.data / np.sqrt(module.running_var + module.eps)
+            affine(scale, module.beta.data - module.running_mean * scale)
+        elif isinstance(module, Dropout):
+            affine(1 - module.p, 0)
+        elif type(module) in _ACTIVATIONS:
+            flush()
+            ops.append({"op": _ACTIVATIONS[type(module)]})
+        else:
+            raise ValueError(f"Слой {module!r} не поддерживается при заморозке модели")
+    flush()
+    return ops, tensors
+
+
+def freeze(model, path, dtype=None):
+    """
+    Сохраняет модель в режиме инференса в один файл для src.runtime.
+
+    Файл содержит плоский список операций и веса; BatchNorm и Dropout встраиваются
+    в соседние слои. Загрузка (src.runtime.load) не импортирует код обучения
+    и отображает веса в память.
+
+    Параметры:
+    ----------
+    model: Sequential
+        Модель из слоёв Linear, BatchNorm, Dropout, ReLU, Sigmoid, Tanh и вложенных Sequential.
+    path: str
+        Путь к создаваемому файлу.
+    dtype: np.dtype, optional
+        Тип весов в файле (например, np.float32). По умолчанию - тип параметров модели
+        (np.float64, если параметров нет).
+
+    Исключения:
+    -----------
+    ValueError
+        Если модель содержит неподдерживаемый слой.
+    """
+    if dtype is None:
+        param = next(iter(model.parameters()), None)
+        dtype = param.data.dtype if param is not None else np.float64
+    ops, tensors = _build_ops(model, dtype)
+
+    # Смещения тензоров отсчитываются от выровненного начала блока данных
+    specs = []
+    offset = 0
+    for tensor in tensors:
+        specs.append({"shape": list(tensor.shape), "dtype": tensor.dtype.str, "offset": offset})
+        offset += runtime._align(tensor.nbytes)
+
+    header = json.dumps({"version": runtime.VERSION, "ops": ops, "tensors": specs}).encode()
+    data_start = runtime._align(len(runtime.MAGIC) + 8 + len(header))
+    with open(path, "wb") as f:
+        f.write(runtime.MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for spec, tensor in zip(specs, tensors):
+            f.seek(data_start + spec["offset"])
+            f.write(tensor.tobytes())
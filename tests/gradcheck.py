@@ -0,0 +1,37 @@
+import numpy as np
+
+
+def numerical_gradient(f, array, eps=1e-6):
+    """Центральные разности функции f() по всем элементам array (изменяется на месте и восстанавливается)."""
+    grad = np.zeros_like(array)
+    for idx in np.ndindex(array.shape):
+        value = array[idx]
+        array[idx] = value + eps
+        plus = f()
+        array[idx] = value - eps
+        minus = f()
+        array[idx] = value
+        grad[idx] = (plus - minus) / (2 * eps)
+    return grad
+
+
+def check_gradients(module, x, forward=None, seed=0, atol=1e-6):
+    """
+    Сравнивает градиенты backward модуля по входу и параметрам с численными.
+
+    Проверяется функция sum(forward(x) * r) со случайным r.
+    """
+    forward = forward if forward is not None else module.forward
+    r = np.random.default_rng(seed).standard_normal(np.shape(forward(x)))
+
+    def loss():
+        return np.sum(forward(x) * r)
+
+    module.zero_grad()
+    forward(x)
+    dx = np.array(module.backward(r))
+    grads = [param.grad.copy() for param in module.parameters()]
+
+    np.testing.assert_allclose(dx, numerical_gradient(loss, x), atol=atol)
+    for param, grad in zip(module.parameters(), grads):
+        np.testing.assert_allclose(grad, numerical_gradient(loss, param.data), atol=atol)
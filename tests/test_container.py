@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from src import parallel
+from src.nn.modules import BatchNorm, Concat, Linear, Parallel, Residual, Sequential, Tanh
+from tests.gradcheck import check_gradients
+
+
+@pytest.fixture(params=[1, 2], ids=["serial", "threads"])
+def num_threads(request):
+    initial = parallel.get_num_threads()
+    parallel.set_num_threads(request.param)
+    yield request.param
+    parallel.set_num_threads(initial)
+
+
+def _branch(in_features, out_features):
+    return Sequential(Linear(in_features, out_features), BatchNorm(out_features), Tanh())
+
+
+def _input():
+    return np.random.default_rng(0).standard_normal((5, 3))
+
+
+def test_parallel_gradients(num_threads):
+    check_gradients(Parallel(_branch(3, 4), Linear(3, 4), Sequential(Linear(3, 4), Tanh())), _input())
+
+
+def test_concat_gradients(num_threads):
+    model = Concat(_branch(3, 2), Linear(3, 4), Tanh())
+    assert model.forward(_input()).shape == (5, 9)
+    check_gradients(model, _input())
+
+
+def test_residual_gradients(num_threads):
+    check_gradients(Residual(Linear(3, 3), Tanh()), _input())
+
+
+def test_nested_gradients(num_threads):
+    model = Residual(Concat(Parallel(Linear(3, 2), _branch(3, 2)), Linear(3, 1)))
+    check_gradients(model, _input())
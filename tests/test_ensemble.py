@@ -0,0 +1,88 @@
+import copy
+
+import numpy as np
+import pytest
+import src
+from src.nn.modules import BatchNorm, CrossEntropyLoss, Dropout, Ensemble, Linear, ReLU, Sequential
+from src.optim import LARS, SGD, Adam
+
+NUM_MEMBERS = 3
+
+
+def _model():
+    # Смещение перед BatchNorm имеет нулевой градиент, и Adam усиливал бы шум округления
+    return Sequential(Linear(5, 8, bias=False), BatchNorm(8), ReLU(), Linear(8, 3))
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((16, 5)), rng.integers(0, 3, 16)
+
+
+def _ensemble():
+    src.manual_seed(0)
+    models = [_model() for _ in range(NUM_MEMBERS)]
+    return models, Ensemble([copy.deepcopy(model) for model in models])
+
+
+def test_member_does_not_advance_random_streams():
+    def build(extract):
+        src.manual_seed(0)
+        ensemble = Ensemble([_model() for _ in range(2)])
+        if extract:
+            ensemble.member(0)
+            ensemble.member(1)
+        return [param.data for param in _model().parameters()]
+
+    for param, expected in zip(build(True), build(False)):
+        np.testing.assert_array_equal(param, expected)
+
+
+@pytest.mark.parametrize("training", [True, False])
+def test_member_matches_stacked_slice(training):
+    _, ensemble = _ensemble()
+    x, y = _data()
+    # Обновляем скользящие статистики, чтобы режим инференса был нетривиальным
+    CrossEntropyLoss(ensemble(x), y)
+    if not training:
+        ensemble.eval()
+    out = ensemble(x).array.copy()
+
+    for i in range(NUM_MEMBERS):
+        member = ensemble.member(i)
+        for param, stacked in zip(member.parameters(), ensemble.parameters()):
+            np.testing.assert_array_equal(param.data, stacked.data[i].reshape(param.data.shape))
+        np.testing.assert_allclose(member(x).array, out[i], rtol=1e-12, atol=1e-12)
+
+
+def test_member_dropout_has_own_stream():
+    models = [Sequential(Linear(4, 4), Dropout(0.5)) for _ in range(2)]
+    ensemble = Ensemble(models)
+    first, second = ensemble.member(0).modules[1], ensemble.member(0).modules[1]
+    assert ensemble.modules[1].generator is not models[0].modules[1].generator
+    assert first.generator is not second.generator
+
+
+@pytest.mark.parametrize("optimizer_cls, kwargs", [
+    (SGD, dict(lr=0.1, weight_decay=1e-3)),
+    (Adam, dict(lr=1e-2, weight_decay=1e-3)),
+    (LARS, dict(lr=0.5, weight_decay=1e-3)),
+])
+def test_training_matches_separate_members(optimizer_cls, kwargs):
+    models, ensemble = _ensemble()
+    x, y = _data()
+    optimizers = [optimizer_cls(model.parameters(), **kwargs) for model in models]
+    ensemble_optimizer = optimizer_cls(ensemble.parameters(), **kwargs)
+
+    for _ in range(3):
+        for model, optimizer in zip(models, optimizers):
+            optimizer.zero_grad()
+            CrossEntropyLoss(model(x), y).backward()
+            optimizer.step()
+        ensemble_optimizer.zero_grad()
+        CrossEntropyLoss(ensemble(x), y).backward()
+        ensemble_optimizer.step()
+
+    for i, model in enumerate(models):
+        for param, expected in zip(ensemble.member(i).parameters(), model.parameters()):
+            np.testing.assert_allclose(param.data, expected.data, rtol=1e-10, atol=1e-12)
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from src import runtime
+from src.nn.modules import BatchNorm, Dropout, Linear, ReLU, Sequential, Sigmoid, Tanh
+from src.utils.export import freeze
+
+
+def _batchnorm(num_features, rng):
+    layer = BatchNorm(num_features)
+    layer.gamma.data = rng.uniform(0.5, 2, num_features)
+    layer.beta.data = rng.standard_normal(num_features)
+    layer.running_mean = rng.standard_normal(num_features)
+    layer.running_var = rng.uniform(0.5, 2, num_features)
+    return layer
+
+
+def _cases():
+    rng = np.random.default_rng(0)
+    return {
+        # BatchNorm и Dropout сразу после Linear встраиваются в него
+        "affine_after_linear": (Sequential(Linear(4, 5), _batchnorm(5, rng), Dropout(0.3), ReLU(), Linear(5, 2)),
+                                ["linear", "relu", "linear"]),
+        # BatchNorm перед Linear встраивается в следующий Linear
+        "affine_before_linear": (Sequential(_batchnorm(4, rng), Linear(4, 5), Tanh(), _batchnorm(5, rng),
+                                            Linear(5, 2)),
+                                 ["linear", "tanh", "linear"]),
+        # После последнего Linear остаётся отдельное покомпонентное преобразование
+        "trailing_affine": (Sequential(Linear(4, 5), Sigmoid(), _batchnorm(5, rng)), ["linear", "sigmoid", "affine"]),
+        "trailing_scale": (Sequential(Linear(4, 5), ReLU(), Dropout(0.25)), ["linear", "relu", "scale"]),
+        "no_bias": (Sequential(_batchnorm(4, rng), Linear(4, 5, bias=False), _batchnorm(5, rng), ReLU(),
+                               Linear(5, 2, bias=False)),
+                    ["linear", "relu", "linear"]),
+    }
+
+
+@pytest.mark.parametrize("name", list(_cases()))
+def test_round_trip(name, tmp_path):
+    model, ops = _cases()[name]
+    model.eval()
+    x = np.random.default_rng(1).standard_normal((6, 4))
+    path = str(tmp_path / "model.bin")
+
+    freeze(model, path)
+    frozen = runtime.load(path)
+
+    assert [op["op"] for op in frozen.ops] == ops
+    np.testing.assert_allclose(frozen(x), model(x).array, rtol=1e-12, atol=1e-12)
+
+
+def test_nested_sequential(tmp_path):
+    rng = np.random.default_rng(0)
+    layers = [Linear(4, 5), _batchnorm(5, rng), ReLU(), Linear(5, 2)]
+    flat = Sequential(*layers)
+    flat.eval()
+    x = np.random.default_rng(1).standard_normal((6, 4))
+    path = str(tmp_path / "model.bin")
+
+    # Вложенный Sequential возвращает Tensor, поэтому выход сравнивается с плоской моделью
+    freeze(Sequential(Sequential(*layers[:2]), *layers[2:]), path)
+    frozen = runtime.load(path)
+
+    assert [op["op"] for op in frozen.ops] == ["linear", "relu", "linear"]
+    np.testing.assert_allclose(frozen(x), flat(x).array, rtol=1e-12, atol=1e-12)
+
+
+def test_float32(tmp_path):
+    model, _ = _cases()["affine_after_linear"]
+    model.eval()
+    x = np.random.default_rng(1).standard_normal((6, 4)).astype(np.float32)
+    path = str(tmp_path / "model.bin")
+
+    freeze(model, path, dtype=np.float32)
+    frozen = runtime.load(path)
+
+    assert all(tensor.dtype == np.float32 for tensor in frozen.tensors)
+    out = frozen(x)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, model(x.astype(np.float64)).array, rtol=1e-4, atol=1e-5)
+
+
+def test_tensors_are_aligned(tmp_path):
+    model, _ = _cases()["affine_before_linear"]
+    path = str(tmp_path / "model.bin")
+    freeze(model, path)
+    frozen = runtime.load(path)
+    assert all(tensor.ctypes.data % runtime.ALIGNMENT == 0 for tensor in frozen.tensors)
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"NOTFROZEN" + bytes(64))
+    with pytest.raises(ValueError):
+        runtime.load(str(path))
+
+
+def test_bad_version(tmp_path):
+    path = tmp_path / "model.bin"
+    freeze(Sequential(Linear(2, 2)), str(path))
+    data = path.read_bytes()
+    marker = f'"version": {runtime.VERSION}'.encode()
+    assert marker in data
+    path.write_bytes(data.replace(marker, f'"version": {runtime.VERSION + 1}'.encode(), 1))
+    with pytest.raises(ValueError):
+        runtime.load(str(path))
+
+
+def test_unsupported_layer(tmp_path):
+    class Custom(ReLU):
+        pass
+
+    with pytest.raises(ValueError):
+        freeze(Sequential(Linear(2, 2), Custom()), str(tmp_path / "model.bin"))
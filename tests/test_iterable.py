@@ -0,0 +1,89 @@
+import gc
+import itertools
+import threading
+
+import numpy as np
+import pytest
+from src.utils.data import IterableDataLoader
+
+NUM_SAMPLES = 103
+
+
+def _source(start=0, stop=NUM_SAMPLES):
+    def samples():
+        for i in range(start, stop):
+            yield np.full(3, i, dtype=np.float32), i
+    return samples
+
+
+def _labels(loader):
+    # Массивы батча переиспользуются, поэтому метки копируются
+    return np.concatenate([labels.copy() for _, labels in loader])
+
+
+@pytest.mark.parametrize("shuffle_buffer_size", [0, 32])
+@pytest.mark.parametrize("parallel_readers", [False, True])
+def test_every_sample_once(shuffle_buffer_size, parallel_readers):
+    loader = IterableDataLoader(shards=[_source(0, 50), _source(50, NUM_SAMPLES)], batch_size=10,
+                                shuffle_buffer_size=shuffle_buffer_size, parallel_readers=parallel_readers)
+    batches = list((data.copy(), labels.copy()) for data, labels in loader)
+    labels = np.concatenate([labels for _, labels in batches])
+    np.testing.assert_array_equal(np.sort(labels), np.arange(NUM_SAMPLES))
+    for data, batch_labels in batches:
+        np.testing.assert_array_equal(data[:, 0], batch_labels)
+    if shuffle_buffer_size:
+        assert not np.array_equal(labels, np.sort(labels))
+
+
+@pytest.mark.parametrize("shuffle_buffer_size", [0, 32])
+def test_drop_last(shuffle_buffer_size):
+    loader = IterableDataLoader(_source(), batch_size=10, shuffle_buffer_size=shuffle_buffer_size, drop_last=True)
+    sizes = [len(labels) for _, labels in loader]
+    labels = _labels(loader)
+    assert sizes == [10] * (NUM_SAMPLES // 10)
+    assert len(np.unique(labels)) == len(labels) == NUM_SAMPLES // 10 * 10
+
+
+def test_shard_order_does_not_depend_on_parallel_readers():
+    shards = [_source(0, 40), _source(40, 45), _source(45, NUM_SAMPLES)]
+    serial = _labels(IterableDataLoader(shards=shards, batch_size=8))
+    threaded = _labels(IterableDataLoader(shards=shards, batch_size=8, parallel_readers=True, prefetch=4))
+    np.testing.assert_array_equal(serial, threaded)
+    # Шарды чередуются по одному примеру
+    np.testing.assert_array_equal(serial[:6], [0, 40, 45, 1, 41, 46])
+
+
+@pytest.mark.parametrize("parallel_readers", [False, True])
+def test_early_exit_stops_readers_and_closes_sources(parallel_readers):
+    closed = []
+
+    def infinite(shard):
+        def samples():
+            try:
+                for i in itertools.count():
+                    yield np.zeros(3), i
+            finally:
+                closed.append(shard)
+        return samples
+
+    initial_threads = threading.active_count()
+    loader = IterableDataLoader(shards=[infinite(0), infinite(1)], batch_size=4,
+                                parallel_readers=parallel_readers, prefetch=8)
+    for _ in range(3):
+        for i, _ in enumerate(loader):
+            if i == 2:
+                break
+    gc.collect()
+    assert threading.active_count() == initial_threads
+    assert sorted(closed) == [0, 0, 0, 1, 1, 1]
+
+
+@pytest.mark.parametrize("parallel_readers", [False, True])
+def test_reader_exception_reaches_consumer(parallel_readers):
+    def broken():
+        yield np.zeros(3), 0
+        raise OSError("boom")
+
+    loader = IterableDataLoader(shards=[_source(), broken], batch_size=4, parallel_readers=parallel_readers)
+    with pytest.raises(OSError, match="boom"):
+        list(loader)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from src.nn.modules import CrossEntropyLoss, Linear, LinearCrossEntropyLoss, Sequential
+from src.tensor import Tensor
+
+IN_FEATURES, NUM_CLASSES, CHUNK_SIZE = 4, 23, 7
+
+
+def _setup():
+    rng = np.random.default_rng(0)
+    criterion = LinearCrossEntropyLoss(IN_FEATURES, NUM_CLASSES, chunk_size=CHUNK_SIZE)
+    criterion.b.data = rng.standard_normal(NUM_CLASSES)
+    linear = Linear(IN_FEATURES, NUM_CLASSES)
+    linear.W.data = criterion.W.data.copy()
+    linear.b.data = criterion.b.data.copy()
+    x = rng.standard_normal((9, IN_FEATURES)) * 3
+    target = rng.integers(0, NUM_CLASSES, 9)
+    return criterion, linear, x, target
+
+
+def test_matches_linear_and_cross_entropy():
+    criterion, linear, x, target = _setup()
+    reference = CrossEntropyLoss(Tensor(linear.forward(x)), target)
+    expected_dx = linear.backward(reference.grad)
+
+    loss = criterion(Tensor(x), target)
+    loss.backward()
+
+    np.testing.assert_allclose(loss.item(), reference.item(), rtol=1e-12)
+    np.testing.assert_allclose(loss.grad, expected_dx, atol=1e-14)
+    np.testing.assert_allclose(criterion.W.grad, linear.W.grad, atol=1e-14)
+    np.testing.assert_allclose(criterion.b.grad, linear.b.grad, atol=1e-14)
+    np.testing.assert_array_equal(criterion.predict(x), np.argmax(linear.forward(x), axis=1))
+
+
+def test_gradient_reaches_model():
+    criterion, linear, x, target = _setup()
+    model = Sequential(Linear(3, IN_FEATURES))
+    inputs = np.random.default_rng(1).standard_normal((9, 3))
+    out = model(inputs)
+    criterion(out, target).backward()
+
+    reference = Linear(3, IN_FEATURES)
+    reference.W.data = model.modules[0].W.data.copy()
+    reference.b.data = model.modules[0].b.data.copy()
+    reference.forward(inputs)
+    reference.backward(CrossEntropyLoss(Tensor(linear.forward(out.array)), target).grad @ linear.W.data.T)
+    np.testing.assert_allclose(model.modules[0].W.grad, reference.W.grad, atol=1e-14)
+
+
+@pytest.mark.parametrize("num_samples", [None, 5])
+def test_loss_without_backward_keeps_gradients(num_samples):
+    criterion, _, x, target = _setup()
+    criterion.num_samples = num_samples
+    criterion(Tensor(x), target)
+    assert not criterion.W.grad.any() and not criterion.b.grad.any()
+
+    criterion(Tensor(x), target).backward()
+    assert criterion.W.grad.any() and criterion.b.grad.any()
+
+
+def test_eval_loss_has_no_backward():
+    criterion, linear, x, target = _setup()
+    criterion.eval()
+    loss = criterion(Tensor(x), target)
+    np.testing.assert_allclose(loss.item(), CrossEntropyLoss(Tensor(linear.forward(x)), target).item(), rtol=1e-12)
+    with pytest.raises(RuntimeError):
+        loss.backward()
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from src.nn.modules import EnsembleLinear, Linear
+from src.nn.parameter import Parameter
+from src.optim import LAMB, LARS
+
+
+def _parameter(data, grad, no_decay=False):
+    param = Parameter(np.shape(data), no_decay=no_decay)
+    param.data = np.array(data, dtype=np.float64)
+    param.grad = np.array(grad, dtype=np.float64)
+    return param
+
+
+def test_lars_trust_ratio():
+    param = _parameter([[3.0, 4.0]], [[0.6, 0.8]])
+    optimizer = LARS([param], lr=0.1, momentum=0, weight_decay=0.1, eta=0.01)
+    # eta * ||w|| / (||g|| + weight_decay * ||w||) = 0.01 * 5 / (1 + 0.5)
+    np.testing.assert_allclose(optimizer.trust_ratios()[0], 0.05 / 1.5)
+
+    optimizer.step()
+    np.testing.assert_allclose(param.data, [[3.0, 4.0]] - 0.1 * (0.05 / 1.5) * np.array([[0.9, 1.2]]))
+
+
+def test_lars_zero_weights_are_not_adapted():
+    param = _parameter([[0.0, 0.0]], [[1.0, 1.0]])
+    assert LARS([param]).trust_ratios()[0] == 1
+
+
+def test_lars_excluded_parameter_is_plain_sgd():
+    bias = _parameter([1.0, 2.0], [0.5, -0.5], no_decay=True)
+    optimizer = LARS([bias], lr=0.1, momentum=0, weight_decay=0.1)
+    assert optimizer.trust_ratios()[0] == 1
+    optimizer.step()
+    np.testing.assert_allclose(bias.data, [0.95, 2.05])
+
+
+def test_lamb_update_norm():
+    weight = _parameter([[3.0, 4.0]], [[1e-3, -2.0]])
+    bias = _parameter([1.0, 2.0], [0.5, -0.5], no_decay=True)
+    optimizer = LAMB([weight, bias], lr=0.01, eps=0, weight_decay=0.1)
+    optimizer.step()
+    # Шаг адаптируемого параметра имеет норму lr * ||w||
+    np.testing.assert_allclose(np.linalg.norm(weight.data - [[3.0, 4.0]]), 0.01 * 5)
+    # Исключённый параметр: обычный первый шаг Adam без weight decay, lr * sign(g)
+    np.testing.assert_allclose(bias.data, [0.99, 2.01])
+
+
+def test_default_exclusion_uses_flag():
+    layer = Linear(3, 2)
+    optimizer = LARS(layer.parameters())
+    np.testing.assert_array_equal(optimizer.exclude, [False, True])
+
+
+@pytest.mark.parametrize("optimizer_cls", [LARS, LAMB])
+def test_ensemble_parameters_have_per_member_ratios(optimizer_cls):
+    rng = np.random.default_rng(0)
+    layers = [Linear(3, 2) for _ in range(3)]
+    for i, layer in enumerate(layers):
+        # Разные масштабы весов дают разные коэффициенты доверия
+        layer.W.data *= i + 1
+        layer.b.data = rng.standard_normal(2)
+    stacked = EnsembleLinear(layers)
+    grads = [rng.standard_normal(layer.W.data.shape) for layer in layers]
+    for layer, grad in zip(layers, grads):
+        layer.W.grad = grad.copy()
+    stacked.W.grad = np.stack(grads)
+
+    members = [optimizer_cls([layer.W], weight_decay=0.01) for layer in layers]
+    ensemble = optimizer_cls([stacked.W], weight_decay=0.01)
+    if optimizer_cls is LARS:
+        ratios = ensemble.trust_ratios()[0]
+        assert ratios.shape == (3, 1, 1)
+        np.testing.assert_allclose(ratios.ravel(), [m.trust_ratios()[0] for m in members])
+
+    for optimizer in members + [ensemble]:
+        optimizer.step()
+    np.testing.assert_allclose(stacked.W.data, np.stack([layer.W.data for layer in layers]))
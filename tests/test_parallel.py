@@ -0,0 +1,105 @@
+import copy
+
+import numpy as np
+import pytest
+from src import parallel
+from src.nn.modules import BatchNorm, CrossEntropyLoss, Linear, Sequential
+from src.optim import Adam
+from src.tensor import Tensor
+
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    num_threads = parallel.get_num_threads()
+    min_size = parallel.get_min_parallel_size()
+    yield
+    parallel.set_num_threads(num_threads)
+    parallel.set_min_parallel_size(min_size)
+
+
+def _run(fn, num_threads, min_size):
+    parallel.set_num_threads(num_threads)
+    parallel.set_min_parallel_size(min_size)
+    return fn()
+
+
+def _compare(fn):
+    """Результаты fn в одном потоке и в четырёх потоках с мелким разбиением совпадают."""
+    expected = _run(fn, 1, 1 << 16)
+    actual = _run(fn, 4, 2)
+    for a, b in zip(actual, expected):
+        np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-14)
+
+
+def test_batchnorm():
+    x = np.random.default_rng(0).standard_normal((37, 5)) * 3 + 1
+    grad = np.random.default_rng(1).standard_normal((37, 5))
+
+    def fn():
+        layer = BatchNorm(5)
+        layer.gamma.data = np.linspace(0.5, 2, 5)
+        out = layer.forward(x)
+        dx = layer.backward(grad)
+        return out, dx, layer.gamma.grad, layer.beta.grad, layer.running_mean, layer.running_var
+
+    _compare(fn)
+
+
+def test_cross_entropy_loss():
+    logits = np.random.default_rng(2).standard_normal((41, 7)) * 5
+    target = np.random.default_rng(3).integers(0, 7, 41)
+
+    def fn():
+        loss = CrossEntropyLoss(Tensor(logits), target)
+        return np.array(loss.loss), loss.grad
+
+    _compare(fn)
+
+
+def test_adam():
+    rng = np.random.default_rng(4)
+    model = Sequential(Linear(6, 9), Linear(9, 3))
+    grads = [[rng.standard_normal(param.data.shape) for param in model.parameters()] for _ in range(3)]
+
+    def fn():
+        params = list(copy.deepcopy(model).parameters())
+        optimizer = Adam(params, lr=1e-2, weight_decay=1e-3)
+        for step_grads in grads:
+            for param, grad in zip(params, step_grads):
+                param.grad[...] = grad
+            optimizer.step()
+        return [param.data for param in params]
+
+    _compare(fn)
+
+
+@pytest.mark.parametrize("min_size", [0, -1])
+def test_min_parallel_size_must_be_positive(min_size):
+    with pytest.raises(ValueError):
+        parallel.set_min_parallel_size(min_size)
+
+
+def test_num_threads_must_be_positive():
+    with pytest.raises(ValueError):
+        parallel.set_num_threads(0)
+
+
+def test_blas_limited_only_inside_parallel_map(monkeypatch):
+    threadpoolctl = pytest.importorskip("threadpoolctl")
+
+    def blas_threads():
+        return [info["num_threads"] for info in threadpoolctl.threadpool_info() if info["user_api"] == "blas"]
+
+    initial = blas_threads()
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 8)
+    parallel.set_num_threads(4)
+    parallel.set_min_parallel_size(1)
+    assert blas_threads() == initial
+    assert parallel.parallel_map(lambda _: blas_threads(), range(2)) == [[4] * len(initial)] * 2
+    assert parallel.parallel_for(lambda _: blas_threads(), np.zeros(8)) == [initial] * 4
+    assert blas_threads() == initial
+
+    parallel.set_num_threads(4, blas_threads=3)
+    assert blas_threads() == [3] * len(initial)
+    parallel.set_num_threads(4)
+    assert blas_threads() == initial
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from src.nn.modules import GRU, LSTM, Linear, Sequential
+from tests.gradcheck import check_gradients
+
+
+@pytest.mark.parametrize("cls", [LSTM, GRU])
+@pytest.mark.parametrize("return_sequences", [True, False])
+@pytest.mark.parametrize("lengths", [None, np.array([4, 1, 3])])
+def test_gradients(cls, return_sequences, lengths):
+    rnn = cls(2, 3, return_sequences=return_sequences)
+    x = np.random.default_rng(1).standard_normal((3, 4, 2))
+    check_gradients(rnn, x, forward=lambda x: rnn.forward(x, lengths))
+
+
+@pytest.mark.parametrize("cls", [LSTM, GRU])
+def test_padding_does_not_change_output(cls):
+    rnn = cls(2, 3, return_sequences=False)
+    x = np.random.default_rng(2).standard_normal((2, 5, 2))
+    out = rnn.forward(x, np.array([5, 2]))
+    np.testing.assert_allclose(out[1], rnn.forward(x[1:, :2])[0])
+
+
+@pytest.mark.parametrize("cls", [LSTM, GRU])
+def test_set_lengths_inside_sequential(cls):
+    rnn = cls(2, 3, return_sequences=False)
+    model = Sequential(rnn, Linear(3, 2))
+    x = np.random.default_rng(3).standard_normal((2, 5, 2))
+    lengths = np.array([5, 2])
+
+    rnn.set_lengths(lengths)
+    out = model(x).array.copy()
+    np.testing.assert_allclose(out, model.modules[1].forward(rnn.forward(x, lengths)))
+    # Длины используются только в одном вызове
+    assert not np.allclose(model(x).array, out)
+
+
+@pytest.mark.parametrize("cls", [LSTM, GRU])
+def test_stateful_batch_size_mismatch(cls):
+    rnn = cls(2, 3, stateful=True)
+    x = np.zeros((2, 4, 2))
+    rnn.forward(x)
+    with pytest.raises(ValueError):
+        rnn.forward(x[:1])
+    rnn.reset_state()
+    rnn.forward(x[:1])